@@ -1,36 +1,105 @@
 # backend/app/adapters/__init__.py
 from __future__ import annotations
 
-from typing import Dict
+import sys
+from functools import lru_cache
+from importlib import import_module
+from typing import Dict, Optional, Type
 
-from app.adapters.base import LanguageAdapter
-from app.adapters.perl_adapter import perl_adapter
-from app.adapters.python_adapter import python_adapter
+from app.adapters.base import LanguageAdapter, LanguageAdapterBase, ServiceHarnessInfo
 
-_ADAPTERS: Dict[str, LanguageAdapter] = {
-    "perl": perl_adapter,
-    "python": python_adapter,
-    # later: "java": java_adapter, etc.
+__all__ = [
+    "LanguageAdapter",
+    "LanguageAdapterBase",
+    "ServiceHarnessInfo",
+    "adapter_images",
+    "get_adapter",
+    "list_adapters",
+    "register_adapter",
+]
+
+# language -> "module:attribute" of the adapter instance.
+# Adapter modules are only imported the first time their language is requested.
+_ADAPTER_PATHS: Dict[str, str] = {
+    "perl": "app.adapters.perl_adapter:perl_adapter",
+    "python": "app.adapters.python_adapter:python_adapter",
+    # later: "java": "app.adapters.java_adapter:java_adapter", etc.
 }
 
+_instances: Dict[str, LanguageAdapter] = {}
+
+# Snapshot built by list_adapters(); reset whenever the registry changes.
+_list_cache: Optional[dict[str, dict]] = None
+
+# language -> docker_image, built by adapter_images(); reset like _list_cache.
+_image_cache: Optional[dict[str, str]] = None
 
+
+def register_adapter(adapter_cls: Type[LanguageAdapterBase]) -> None:
+    """
+    Register an adapter class outside the built-in table (plugins, tests).
+    """
+    global _list_cache, _image_cache
+    instance = adapter_cls()
+    _instances[sys.intern(instance.name.lower())] = instance
+    get_adapter.cache_clear()
+    _list_cache = None
+    _image_cache = None
+
+
+@lru_cache(maxsize=16)
 def get_adapter(language: str) -> LanguageAdapter:
     key = language.lower()
-    if key not in _ADAPTERS:
+    adapter = _instances.get(key)
+    if adapter is not None:
+        return adapter
+
+    path = _ADAPTER_PATHS.get(key)
+    if path is None:
         raise KeyError(f"No adapter registered for language '{language}'")
-    return _ADAPTERS[key]
+
+    module_name, attr = path.split(":", 1)
+    adapter = getattr(import_module(module_name), attr)
+    _instances[sys.intern(key)] = adapter
+    return adapter
 
 
 def list_adapters() -> dict[str, dict]:
     """
     For config/diagnostic endpoint.
+
+    Materializes each adapter on demand; this is the only place that needs
+    every language loaded. The result is built once and cached until the
+    next register_adapter(); callers get their own copy.
     """
+    global _list_cache
+    if _list_cache is None:
+        snapshot: dict[str, dict] = {}
+        for name in dict.fromkeys([*_ADAPTER_PATHS, *_instances]):
+            adapter = get_adapter(name)
+            snapshot[name] = {
+                "name": adapter.name,
+                "file_extensions": tuple(adapter.file_extensions),
+                "runtime_image": adapter.service_image(),
+                "service_internal_port": adapter.service_internal_port(),
+            }
+        _list_cache = snapshot
+
     return {
-        name: {
-            "name": adapter.name,
-            "file_extensions": list(adapter.file_extensions),
-            "runtime_image": adapter.runtime_image,
-            "service_internal_port": adapter.service_internal_port,
-        }
-        for name, adapter in _ADAPTERS.items()
+        name: {**info, "file_extensions": list(info["file_extensions"])}
+        for name, info in _list_cache.items()
     }
+
+
+def adapter_images() -> dict[str, str]:
+    """
+    Test-run image per language ({language: docker_image}), e.g. for
+    prefetching at startup. Built once, like list_adapters().
+    """
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = {
+            name: get_adapter(name).docker_image
+            for name in dict.fromkeys([*_ADAPTER_PATHS, *_instances])
+        }
+    return dict(_image_cache)
@@ -1,15 +1,44 @@
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Type, List
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 
+__all__ = [
+    "BehaviorLike",
+    "ContractLike",
+    "LanguageAdapter",
+    "LanguageAdapterBase",
+    "ServiceHarnessInfo",
+    "write_if_changed",
+]
 
-@dataclass
+
+class BehaviorLike(Protocol):
+    """Attributes adapters read from a Behavior (usually the ORM row)."""
+
+    id: int
+    name: str
+    description: Optional[str]
+
+
+class ContractLike(Protocol):
+    """Attributes adapters read from a BehaviorContract (usually the ORM row)."""
+
+    id: int
+    name: str
+    test_cases: Any
+
+
+@dataclass(slots=True, frozen=True)
 class ServiceHarnessInfo:
     """
-    Metadata returned by LanguageAdapter.generate_service_harness.
+    Metadata returned by LanguageAdapter.generate_service_harness (read-only;
+    use dataclasses.replace to derive a modified copy).
 
     context_dir:
         Directory used as Docker build context (usually the cloned repo root).
@@ -22,10 +51,226 @@ class ServiceHarnessInfo:
     dockerfile_path: Path
     internal_port: int
 
-class LanguageAdapter(ABC):
+
+@lru_cache(maxsize=4096)
+def _cached_path(raw: str) -> Path:
+    return Path(raw)
+
+
+def _as_path(path: Path | str) -> Path:
+    """
+    Coerce `path` to a Path, reusing instances for repeated string inputs.
+
+    detect() is called once per candidate file during repo scans, and
+    parsing the same strings into Path objects over and over adds up.
+    """
+    if isinstance(path, Path):
+        return path
+    return _cached_path(path)
+
+
+# Directories that never hold project sources; pruned from detection walks.
+# Virtualenvs are included: a vendored site-packages is full of .py files
+# and would make any checkout look like a Python project.
+_SKIP_DIRS = frozenset(
+    {".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", ".tox"}
+)
+
+
+def _tree_has_suffix(
+    root: Path | str,
+    suffixes: tuple[str, ...],
+    max_files: int | None = None,
+    max_depth: int | None = None,
+    verify: Callable[[str], bool] | None = None,
+) -> bool:
+    """
+    Breadth-first os.scandir walk of `root`, returning True as soon as a file
+    name ends with one of `suffixes` (and, if given, `verify(file_path)` agrees).
+
+    DirEntry type checks reuse the data readdir already returned, so no
+    per-entry stat is needed. Symlinked directories are not followed. If
+    `max_files` files have been seen, or nothing is found within `max_depth`
+    levels below `root`, the result is False.
+
+    Each adapter's detect() walks on its own: nothing detects several
+    languages over one tree, and stopping at the first match is cheaper
+    than indexing the whole tree up front.
     """
-    Per-language interface used by the conversion engine, test harness,
-    and (optionally) runtime service deployment.
+    queue: deque[tuple[str, int]] = deque([(os.fspath(root), 0)])
+    seen = 0
+    while queue:
+        dir_path, depth = queue.popleft()
+        try:
+            it = os.scandir(dir_path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if entry.name not in _SKIP_DIRS and (
+                        max_depth is None or depth < max_depth
+                    ):
+                        queue.append((entry.path, depth + 1))
+                    continue
+                if entry.name.endswith(suffixes) and (
+                    verify is None or verify(entry.path)
+                ):
+                    return True
+                seen += 1
+                if max_files is not None and seen >= max_files:
+                    return False
+    return False
+
+
+# (contract id, updated_at) -> serialized test_cases
+_CASES_JSON_CACHE: Dict[Tuple[Any, Any], str] = {}
+_CASES_JSON_CACHE_MAX = 128
+
+
+@lru_cache(maxsize=None)
+def _compact_json_dumps() -> Callable[[Any], str]:
+    # Imported on first use: only codegen needs a serializer, and orjson
+    # alone is several ms of import time for workers that never generate.
+    try:  # optional fast path
+        import orjson
+    except ImportError:  # orjson not installed; fall back to stdlib json
+        import json
+
+        return lambda obj: json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return lambda obj: orjson.dumps(obj).decode("utf-8")
+
+
+def _dump_test_cases(test_cases: Any) -> str:
+    # Compact: the embedded JSON is only ever read back by a parser.
+    return _compact_json_dumps()(test_cases)
+
+
+def _test_cases_json(contract, test_cases: Any) -> str:
+    """
+    Serialize contract test_cases for embedding, memoized per contract revision.
+
+    Contracts without an id/updated_at (e.g. unsaved objects) are not cached.
+    """
+    key = (getattr(contract, "id", None), getattr(contract, "updated_at", None))
+    if key[0] is None or key[1] is None:
+        return _dump_test_cases(test_cases)
+
+    cached = _CASES_JSON_CACHE.get(key)
+    if cached is None:
+        if len(_CASES_JSON_CACHE) >= _CASES_JSON_CACHE_MAX:
+            _CASES_JSON_CACHE.clear()
+        cached = _CASES_JSON_CACHE[key] = _dump_test_cases(test_cases)
+    return cached
+
+
+def _ensure_dir(path: Path) -> None:
+    """
+    mkdir -p, but a single stat when the directory already exists (the usual
+    case on regeneration) instead of a failing mkdir plus a stat.
+    """
+    if not os.path.isdir(path):
+        path.mkdir(parents=True, exist_ok=True)
+
+
+def write_if_changed(path: Path, content: str | bytes) -> bool:
+    """
+    Write `content` to `path` unless the file already holds exactly that text.
+
+    Leaving identical files untouched keeps their mtime stable, which
+    preserves container build-cache layers. Returns True if a write happened.
+    Static content can be passed pre-encoded (UTF-8 bytes) to skip encoding.
+    """
+    data = content if isinstance(content, bytes) else content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    # Unbuffered: one write(2) for the whole payload (contract tests with many
+    # cases can be large), looping only if the kernel takes a short write.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
+@runtime_checkable
+class LanguageAdapter(Protocol):
+    """
+    Structural interface for language adapters, used for type hints.
+
+    Concrete adapters inherit the shared implementation from
+    LanguageAdapterBase; see that class for the contract of each hook.
+    """
+
+    name: str
+    file_extensions: List[str]
+    docker_image: str
+
+    def detect(self, path: Path | str) -> bool: ...
+
+    def build_command(
+        self, project_root: str | Path, host_root: Path | None = None
+    ) -> list[str] | str | None: ...
+
+    def test_command(
+        self, project_root: str | Path, host_root: Path | None = None
+    ) -> list[str] | str: ...
+
+    def run_contract_test_command(
+        self,
+        behavior_id: int,
+        contract_id: int | None,
+        project_root: str | Path = "/tests",
+        host_root: Path | None = None,
+    ) -> list[str] | str: ...
+
+    def generate_test_code_from_contract(
+        self, contract: ContractLike | None, output_path: str | Path
+    ) -> None: ...
+
+    def generate_skeleton_from_behavior(
+        self,
+        behavior: BehaviorLike,
+        contract: ContractLike | None,
+        output_path: str | Path,
+    ) -> None: ...
+
+    def generate_service_harness(
+        self,
+        behavior,
+        implementation,
+        contract,
+        repo_root: Path,
+    ) -> ServiceHarnessInfo: ...
+
+    def service_image(self) -> str: ...
+
+    def service_internal_port(self) -> int: ...
+
+    def prepare_service_workspace(self, code_root: str | Path) -> None: ...
+
+    def service_command(self, code_root: str | Path) -> list[str]: ...
+
+
+class LanguageAdapterBase(ABC):
+    """
+    Shared implementation for the per-language adapters used by the
+    conversion engine, test harness, and (optionally) runtime service
+    deployment.
+
+    Kept an ABC so an adapter missing a hook fails when it is instantiated,
+    not halfway through a conversion. Adapters are created once per process
+    and cached by get_adapter, so ABCMeta's instantiation cost is paid once.
     """
 
     # Must be set by subclasses
@@ -41,32 +286,50 @@ class LanguageAdapter(ABC):
         if not getattr(self, "docker_image", None):
             raise ValueError("Adapter must define docker_image")
 
+        # Hashed lookup for suffix checks; file_extensions stays a list for callers.
+        self._ext_set: frozenset[str] = frozenset(self.file_extensions)
+
     def detect(self, path: Path | str) -> bool:
         """
         Default detection: treat `path` as a file path and check extension.
         Subclasses may override with richer heuristics.
         """
-        p = Path(path)
-        return p.suffix in self.file_extensions
+        p = _as_path(path)
+        return p.suffix in self._ext_set
 
     # ------------------------------------------------------------------
     # Build / test (single-repo)
     # ------------------------------------------------------------------
 
     @abstractmethod
-    def build_command(self, project_root: str | Path) -> list[str] | str | None:
+    def build_command(
+        self,
+        project_root: str | Path,
+        host_root: Path | None = None,
+    ) -> list[str] | str | None:
         """
         Return a shell command (string or argv list) to build the project.
 
         - May return None to indicate "no build step".
         - `project_root` will be the directory where the repo was checked out.
+        - `host_root` is the same checkout on the host, if known (see
+          test_command).
         """
         ...
 
     @abstractmethod
-    def test_command(self, project_root: str | Path) -> list[str] | str:
+    def test_command(
+        self,
+        project_root: str | Path,
+        host_root: Path | None = None,
+    ) -> list[str] | str:
         """
         Return a shell command (string or argv list) to run tests in a single repo.
+
+        - `host_root` is the host-side checkout mounted at `project_root`, when
+          the caller has one. Adapters can inspect it to pick a command up front
+          and return an argv list, which runners exec directly (with
+          `project_root` as the working directory) instead of via `sh -c`.
         """
         ...
 
@@ -80,6 +343,7 @@ class LanguageAdapter(ABC):
         behavior_id: int,
         contract_id: int | None,
         project_root: str | Path = "/tests",
+        host_root: Path | None = None,
     ) -> list[str] | str:
         """
         Command to run contract-based tests inside a paired container.
@@ -92,6 +356,8 @@ class LanguageAdapter(ABC):
           - `project_root` is mounted and used as cwd for the command.
           - Language-specific env vars (e.g., PYTHONPATH, PERL5LIB) may need
             to be set here.
+          - `host_root`, if given, is the host-side harness checkout (see
+            test_command).
         """
         ...
 
@@ -153,7 +419,7 @@ class LanguageAdapter(ABC):
     # ------------------------------------------------------------------
     # Service deployment hooks (runtime UI / HTTP services)
     #
-    # These are *not* abstract to keep backwards compatibility.
+    # Unlike the hooks above, these have working defaults.
     # Adapters can override as needed. service_deployer can rely on them.
     # ------------------------------------------------------------------
 
@@ -197,25 +463,3 @@ class LanguageAdapter(ABC):
         raise NotImplementedError(
             f"service_command is not implemented for language adapter '{self.name}'"
         )
-
-
-_ADAPTERS: Dict[str, LanguageAdapter] = {}
-
-
-def register_adapter(adapter_cls: Type[LanguageAdapter]) -> None:
-    instance = adapter_cls()
-    _ADAPTERS[instance.name.lower()] = instance
-
-
-def get_adapter(language: str) -> LanguageAdapter:
-    language_norm = language.lower()
-    if language_norm not in _ADAPTERS:
-        raise ValueError(f"No adapter registered for language '{language}'")
-    return _ADAPTERS[language_norm]
-
-
-def list_adapters() -> dict[str, str]:
-    """
-    Returns mapping language -> docker_image.
-    """
-    return {name: adapter.docker_image for name, adapter in _ADAPTERS.items()}
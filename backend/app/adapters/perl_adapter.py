@@ -1,15 +1,222 @@
 # app/adapters/perl_adapter.py
 from __future__ import annotations
 
-import json
 import os
+import re
+import stat
+import sys
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
+from string import Template
 from typing import List, Union
 
-from app.adapters.base import LanguageAdapter, ServiceHarnessInfo
+from app.adapters.base import (
+    BehaviorLike,
+    ContractLike,
+    LanguageAdapterBase,
+    ServiceHarnessInfo,
+    _as_path,
+    _ensure_dir,
+    _test_cases_json,
+    _tree_has_suffix,
+    write_if_changed,
+)
+
+_PERL_EXTENSIONS = tuple(
+    sys.intern(ext)
+    for ext in (".pl", ".pm", ".cgi", ".plx", ".pls", ".psgi", ".fcgi")
+)
+_PERL_PROJECT_MARKERS = ("Makefile.PL", "Build.PL", "cpanfile")
+# Extensions Perl shares with another language (.pl is also Prolog). These
+# count as Perl unless the file head shows Prolog: a `:-` directive, or a
+# `head(...) :-` clause, at the start of a line.
+_AMBIGUOUS_EXTENSIONS = (".pl",)
+_PROLOG_CONTENT_RE = re.compile(
+    rb"^[ \t]*(?::-|[a-z]\w*(?:\([^\n]*\))?[ \t]*:-)",
+    re.M,
+)
+# Runs of whitespace, colons, slashes or dashes become a single "::" in
+# generated package names ("Plot Generator/Util" -> "Plot::Generator::Util").
+_PKG_SEP_RE = re.compile(r"[\s:/\-]+")
+# Runtime deps for the PSGI service harness, installed via cpanm --installdeps.
+_HARNESS_CPANFILE = "cpanfile.harness"
+_HARNESS_CPANFILE_CONTENTS = "".join(
+    f"requires '{module}';\n"
+    for module in (
+        "GD::Graph",
+        "JSON",
+        "File::Slurp",
+        "Plack",
+        "CGI::Emulate::PSGI",
+        "CGI::Compile",
+    )
+)
+
+# --- Static TAP test files written by generate_test_code_from_contract ---
+# (bytes literals: static content, so there's nothing to encode per call)
+
+# 00-load.t: very simple sanity test
+_LOAD_TEST_B = b"""#!/usr/bin/env perl
+use strict;
+use warnings;
+use Test::More;
+
+ok(1, 'test harness loaded');
+
+done_testing();
+"""
+
+# 01-basic.t: placeholder that can be extended later
+_BASIC_TEST_B = b"""#!/usr/bin/env perl
+use strict;
+use warnings;
+use Test::More;
+
+# TODO: load the legacy module under test here, e.g.:
+# use lib '/code/lib';
+# use Plot::Generator;
+
+ok(1, 'basic placeholder test');
+
+done_testing();
+"""
+
+
+# 02-contract.t when the contract has no test_cases
+_NO_CASES_T = Template("""#!/usr/bin/env perl
+use strict;
+use warnings;
+use Test::More;
+
+# No test_cases found on contract ${contract_id} ${contract_name}
+ok(1, 'no contract test cases defined yet');
+
+done_testing();
+""")
+
+# 02-contract.t: contract-driven tests using embedded JSON.
+# Perl sigils are escaped as $$ for string.Template.
+_CONTRACT_T = Template("""#!/usr/bin/env perl
+use strict;
+use warnings;
+use Test::More;
+use JSON qw(decode_json);
+
+# Contract-driven tests for:
+#   contract id   : ${contract_id}
+#   contract name : ${contract_name}
+
+my $$json = <<'JSON';
+${json_text}
+JSON
+
+my $$cases = decode_json($$json);
+
+foreach my $$case (@$$cases) {
+    my $$name = $$case->{'name'} // 'unnamed_case';
+
+    TODO: {
+        local $$TODO = 'Implement real contract-based assertions for this case';
+
+        # Examples of what you might do here once wired to real code:
+        #   - Call a module function / method with $$case->{'input'}
+        #   - Compare results to $$case->{'expect'}
+        #   - Use is_deeply, like, cmp_ok, etc.
+        #
+        # For now we just mark the test as a TODO placeholder.
+        ok(1, "placeholder for contract case $$name");
+    }
+}
+
+done_testing();
+""")
+
+
+@lru_cache(maxsize=64)
+def _render_psgi(cgi_posix: str) -> str:
+    """app.psgi wrapping the CGI script at `cgi_posix` (repo-relative)."""
+    return f"""use strict;
+use warnings;
+use FindBin;
+use lib "$FindBin::Bin/lib";
+
+use CGI::Compile;
+use CGI::Emulate::PSGI;
+
+# Wrap the legacy CGI script:
+my $cgi_app = CGI::Compile->compile("{cgi_posix}");
+my $app     = CGI::Emulate::PSGI->handler($cgi_app);
+
+# Plack expects to see a PSGI app in $_[0]:
+$app;
+"""
+
+
+@lru_cache(maxsize=64)
+def _render_dockerfile(base_image: str) -> str:
+    """Dockerfile for the PSGI service harness built on `base_image`."""
+    return f"""FROM {base_image}
+
+WORKDIR /app
 
+# System libraries for GD
+RUN apt-get update \\
+    && apt-get install -y --no-install-recommends \\
+        cpanminus \\
+        libgd-dev \\
+    && apt-get clean \\
+    && rm -rf /var/lib/apt/lists/*
 
-class PerlAdapter(LanguageAdapter):
+# Install dependencies for plotting + PSGI before copying sources, so code
+# changes reuse this layer; the cache mount keeps cpanm's build dir warm.
+COPY {_HARNESS_CPANFILE} /app/{_HARNESS_CPANFILE}
+RUN --mount=type=cache,target=/root/.cpanm \\
+    cpanm --notest --installdeps --cpanfile {_HARNESS_CPANFILE} .
+
+COPY . /app
+
+EXPOSE 5000
+
+CMD ["plackup", "-Ilib", "-p", "5000", "app.psgi"]
+"""
+
+
+def _is_perl_source(file_path: str) -> bool:
+    """
+    Content check for extensions Perl shares with other languages: .pl is
+    Perl unless its first 512 bytes look like Prolog. Other Perl extensions
+    are accepted on suffix alone.
+    """
+    if not file_path.endswith(_AMBIGUOUS_EXTENSIONS):
+        return True
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        # No evidence either way; the suffix decides.
+        return True
+    try:
+        head = os.read(fd, 512)
+    finally:
+        os.close(fd)
+    return _PROLOG_CONTENT_RE.search(head) is None
+
+
+@lru_cache(maxsize=1024)
+def _detect_perl_dir(dir_path: str, mtime_ns: int, max_files: int, max_depth: int) -> bool:
+    # mtime_ns is unused here; it keys the cache so directory edits force a rescan.
+    for marker in _PERL_PROJECT_MARKERS:
+        if os.path.exists(os.path.join(dir_path, marker)):
+            return True
+    return _tree_has_suffix(
+        dir_path,
+        _PERL_EXTENSIONS,
+        max_files=max_files,
+        max_depth=max_depth,
+        verify=_is_perl_source,
+    )
+
+
+class PerlAdapter(LanguageAdapterBase):
     """
     Perl language adapter.
 
@@ -22,37 +229,50 @@ class PerlAdapter(LanguageAdapter):
     """
 
     # Adapter identity
-    name: str = "perl"
-    file_extensions: List[str] = [".pl", ".pm", ".cgi", ".plx", ".pls", ".psgi", ".fcgi"]
+    name: str = sys.intern("perl")
+    file_extensions: List[str] = list(_PERL_EXTENSIONS)
     # Official Perl image; has `prove` available.
-    docker_image: str = "perl:5.38"
+    docker_image: str = sys.intern("perl:5.38")
+
+    # Detection budget: give up (not Perl) after this many files / this deep.
+    _DETECT_MAX_FILES: int = 5000
+    _DETECT_MAX_DEPTH: int = 6
 
     # ---------- Detection ----------
 
     def detect(self, path: str) -> bool:
         """
         Heuristic: Perl if we see .pl/.pm files or common CPAN-style structure.
-        """
-        p = Path(path)
-        if p.is_file() and p.suffix in self.file_extensions:
-            return True
-
-        if p.is_dir():
-            # Any .pl/.pm/.cgi under this directory
-            for child in p.rglob("*"):
-                if child.suffix in self.file_extensions:
-                    return True
-
-            # Common Perl project markers
-            for marker in ("Makefile.PL", "Build.PL", "cpanfile"):
-                if (p / marker).exists():
-                    return True
 
+        Directory walks are bounded by _DETECT_MAX_FILES / _DETECT_MAX_DEPTH,
+        so very large trees resolve to False in bounded time. Directory
+        results are cached per (path, mtime); note a directory's mtime only
+        moves when its direct entries change.
+        """
+        p = _as_path(path)
+        try:
+            st = p.stat()
+        except OSError:
+            return False
+
+        if stat.S_ISREG(st.st_mode):
+            return p.suffix in self._ext_set and _is_perl_source(str(p))
+        if stat.S_ISDIR(st.st_mode):
+            return _detect_perl_dir(
+                os.path.abspath(p),
+                st.st_mtime_ns,
+                self._DETECT_MAX_FILES,
+                self._DETECT_MAX_DEPTH,
+            )
         return False
 
     # ---------- Build / Test commands (single-repo) ----------
 
-    def build_command(self, project_root: str) -> Union[str, List[str], None]:
+    def build_command(
+        self,
+        project_root: str,
+        host_root: Path | None = None,
+    ) -> Union[str, List[str], None]:
         """
         No explicit build step for plain Perl scripts/modules.
 
@@ -61,10 +281,16 @@ class PerlAdapter(LanguageAdapter):
         """
         return None
 
-    def test_command(self, project_root: str) -> Union[str, List[str]]:
+    def test_command(
+        self,
+        project_root: str,
+        host_root: Path | None = None,
+    ) -> Union[str, List[str]]:
         """
-        Generic test command for a Perl project in a single repo:
+        Generic test command for a Perl project in a single repo.
 
+        Always a shell chain (`host_root` is unused), so the fallbacks below
+        apply however the runner invokes it:
         - cd into project_root
         - If t/ exists -> run `prove -r t`
         - else -> try `prove -r .`
@@ -91,6 +317,7 @@ class PerlAdapter(LanguageAdapter):
         behavior_id: int,
         contract_id: int | None,
         project_root: str = "/tests",
+        host_root: Path | None = None,
     ) -> Union[str, List[str]]:
         """
         Command used when running harness tests against legacy code in a *paired*
@@ -101,7 +328,8 @@ class PerlAdapter(LanguageAdapter):
           /tests -> harness repo (working dir)
 
         We set PERL5LIB to include /code and /code/lib so harness tests
-        can `use` the legacy modules.
+        can `use` the legacy modules. As with test_command, this stays a
+        shell chain (keeping the `prove -r .` fallback); `host_root` is unused.
         """
         cmd = (
             f"cd {project_root} && "
@@ -116,7 +344,11 @@ class PerlAdapter(LanguageAdapter):
 
     # ---------- Code generation hooks ----------
 
-    def generate_test_code_from_contract(self, contract, output_path: str) -> None:
+    def generate_test_code_from_contract(
+        self,
+        contract: ContractLike | None,
+        output_path: str,
+    ) -> None:
         """
         Generate Perl TAP tests (.t files) under output_path/t/.
 
@@ -128,100 +360,47 @@ class PerlAdapter(LanguageAdapter):
         - t/01-basic.t     : basic placeholder test
         - t/02-contract.t  : per-contract-case TODO tests
         """
-        t_dir = os.path.join(output_path, "t")
-        os.makedirs(t_dir, exist_ok=True)
-
-        # --- 00-load.t: very simple sanity test ---
-        load_test = """#!/usr/bin/env perl
-use strict;
-use warnings;
-use Test::More;
-
-ok(1, 'test harness loaded');
-
-done_testing();
-"""
-        with open(os.path.join(t_dir, "00-load.t"), "w") as f:
-            f.write(load_test)
-
-        # --- 01-basic.t: placeholder that can be extended later ---
-        basic_test = """#!/usr/bin/env perl
-use strict;
-use warnings;
-use Test::More;
-
-# TODO: load the legacy module under test here, e.g.:
-# use lib '/code/lib';
-# use Plot::Generator;
-
-ok(1, 'basic placeholder test');
-
-done_testing();
-"""
-        with open(os.path.join(t_dir, "01-basic.t"), "w") as f:
-            f.write(basic_test)
+        t_dir = Path(output_path) / "t"
+        _ensure_dir(t_dir)
 
         # --- 02-contract.t: contract-driven tests using embedded JSON ---
-        test_cases = getattr(contract, "test_cases", None) if contract else None
+        test_cases = contract.test_cases if contract else None
 
         if not test_cases:
             # No test cases -> simple placeholder
-            contract_id = getattr(contract, "id", "unknown") if contract else "unknown"
-            contract_name = getattr(contract, "name", f"behavior_{contract_id}") if contract else ""
-            contract_test = f"""#!/usr/bin/env perl
-use strict;
-use warnings;
-use Test::More;
-
-# No test_cases found on contract {contract_id} {contract_name}
-ok(1, 'no contract test cases defined yet');
-
-done_testing();
-"""
+            contract_id = contract.id if contract else "unknown"
+            contract_name = contract.name if contract else ""
+            contract_test = _NO_CASES_T.substitute(
+                contract_id=contract_id,
+                contract_name=contract_name,
+            )
         else:
             # Serialize test_cases to JSON and embed it in the Perl test.
-            json_text = json.dumps(test_cases, indent=2)
-            contract_id = getattr(contract, "id", "unknown")
-            contract_name = getattr(contract, "name", f"behavior_{contract_id}")
-
-            contract_test = f"""#!/usr/bin/env perl
-use strict;
-use warnings;
-use Test::More;
-use JSON qw(decode_json);
-
-# Contract-driven tests for:
-#   contract id   : {contract_id}
-#   contract name : {contract_name}
-
-my $json = <<'JSON';
-{json_text}
-JSON
-
-my $cases = decode_json($json);
-
-foreach my $case (@$cases) {{
-    my $name = $case->{{'name'}} // 'unnamed_case';
-
-    TODO: {{
-        local $TODO = 'Implement real contract-based assertions for this case';
+            json_text = _test_cases_json(contract, test_cases)
+            contract_id = contract.id
+            contract_name = contract.name
+
+            contract_test = _CONTRACT_T.substitute(
+                contract_id=contract_id,
+                contract_name=contract_name,
+                json_text=json_text,
+            )
 
-        # Examples of what you might do here once wired to real code:
-        #   - Call a module function / method with $case->{{'input'}}
-        #   - Compare results to $case->{{'expect'}}
-        #   - Use is_deeply, like, cmp_ok, etc.
-        #
-        # For now we just mark the test as a TODO placeholder.
-        ok(1, "placeholder for contract case $name");
-    }}
-}}
+        # Files whose contents are already current are left untouched, so
+        # regenerating an unchanged contract does no writes.
+        for name, content in (
+            ("00-load.t", _LOAD_TEST_B),
+            ("01-basic.t", _BASIC_TEST_B),
+            ("02-contract.t", contract_test),
+        ):
+            write_if_changed(t_dir / name, content)
 
-done_testing();
-"""
-        with open(os.path.join(t_dir, "02-contract.t"), "w") as f:
-            f.write(contract_test)
-
-    def generate_skeleton_from_behavior(self, behavior, contract, output_path: str) -> None:
+    def generate_skeleton_from_behavior(
+        self,
+        behavior: BehaviorLike,
+        contract: ContractLike | None,
+        output_path: str,
+    ) -> None:
         """
         Generate a simple Perl module skeleton for the given behavior.
 
@@ -229,13 +408,13 @@ done_testing();
         - Adds a package with a stub subroutine `run(%args)`
         """
         out_dir = Path(output_path)
-        out_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(out_dir)
 
-        raw_name = getattr(behavior, "name", "Behavior")
+        raw_name = behavior.name or "Behavior"
         # Make a safe package name: replace non-word-ish separators with ::
-        package = raw_name.replace(":", "::").replace(" ", "::")
+        package = _PKG_SEP_RE.sub("::", raw_name).strip(":")
         if not package:
-            package = f"Behavior{getattr(behavior, 'id', '')}"
+            package = f"Behavior{behavior.id}"
 
         # Use last segment as file name
         file_segment = package.split("::")[-1] or "Behavior"
@@ -244,35 +423,32 @@ done_testing();
             # Don't overwrite existing file
             return
 
-        behavior_desc = getattr(behavior, "description", "").strip()
-        contract_id = getattr(contract, "id", None)
-        contract_name = getattr(contract, "name", "") if contract else ""
-
-        lines: list[str] = []
-        lines.append(f"package {package};")
-        lines.append("use strict;")
-        lines.append("use warnings;")
-        lines.append("")
-        lines.append("our $VERSION = '0.01';")
-        lines.append("")
-        if behavior_desc:
-            lines.append("# " + behavior_desc)
-            lines.append("")
-        if contract_id is not None:
-            lines.append(
-                "# Skeleton generated from contract "
-                f"{contract_id}" + (f" ({contract_name})" if contract_name else "")
-            )
-            lines.append("")
-        lines.append("sub run {")
-        lines.append("    my (%args) = @_;")
-        lines.append("    die 'Not implemented yet';")
-        lines.append("}")
-        lines.append("")
-        lines.append("1;")
-        lines.append("")
+        behavior_desc = (behavior.description or "").strip()
+        contract_id = contract.id if contract else None
+        contract_name = contract.name if contract else ""
 
-        file_path.write_text("\n".join(lines))
+        desc_block = f"# {behavior_desc}\n\n" if behavior_desc else ""
+        contract_block = ""
+        if contract_id is not None:
+            suffix = f" ({contract_name})" if contract_name else ""
+            contract_block = f"# Skeleton generated from contract {contract_id}{suffix}\n\n"
+
+        file_path.write_text(
+            f"package {package};\n"
+            "use strict;\n"
+            "use warnings;\n"
+            "\n"
+            "our $VERSION = '0.01';\n"
+            "\n"
+            f"{desc_block}"
+            f"{contract_block}"
+            "sub run {\n"
+            "    my (%args) = @_;\n"
+            "    die 'Not implemented yet';\n"
+            "}\n"
+            "\n"
+            "1;\n"
+        )
 
     # ---------- NEW: service harness generation ----------
 
@@ -305,49 +481,15 @@ done_testing();
         cgi_posix = str(PurePosixPath(cgi_rel))
 
         app_psgi = repo_root / "app.psgi"
-        app_psgi_contents = f"""use strict;
-use warnings;
-use FindBin;
-use lib "$FindBin::Bin/lib";
-
-use CGI::Compile;
-use CGI::Emulate::PSGI;
-
-# Wrap the legacy CGI script:
-my $cgi_app = CGI::Compile->compile("{cgi_posix}");
-my $app     = CGI::Emulate::PSGI->handler($cgi_app);
+        write_if_changed(app_psgi, _render_psgi(cgi_posix))
 
-# Plack expects to see a PSGI app in $_[0]:
-$app;
-"""
-        app_psgi.write_text(app_psgi_contents)
+        # Dependencies go in their own cpanfile (not the repo's, if it has one)
+        # so the Dockerfile install layer is only rebuilt when this list changes.
+        cpanfile_path = repo_root / _HARNESS_CPANFILE
+        write_if_changed(cpanfile_path, _HARNESS_CPANFILE_CONTENTS)
 
         dockerfile_path = repo_root / "Dockerfile"
-        dockerfile_contents = f"""FROM {self.docker_image}
-
-WORKDIR /app
-COPY . /app
-
-# Install dependencies for plotting + PSGI
-RUN apt-get update \\
-    && apt-get install -y --no-install-recommends \\
-        cpanminus \\
-        libgd-dev \\
-    && cpanm --notest \\
-        GD::Graph \\
-        JSON \\
-        File::Slurp \\
-        Plack \\
-        CGI::Emulate::PSGI \\
-        CGI::Compile \\
-    && apt-get clean \\
-    && rm -rf /var/lib/apt/lists/*
-
-EXPOSE 5000
-
-CMD ["plackup", "-Ilib", "-p", "5000", "app.psgi"]
-"""
-        dockerfile_path.write_text(dockerfile_contents)
+        write_if_changed(dockerfile_path, _render_dockerfile(self.docker_image))
 
         return ServiceHarnessInfo(
             context_dir=repo_root,
@@ -1,15 +1,237 @@
 # app/adapters/python_adapter.py
 from __future__ import annotations
 
-import json
 import os
+import re
+import stat
+import sys
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
+from string import Template
 from typing import List, Union
 
-from app.adapters.base import LanguageAdapter, ServiceHarnessInfo
+from app.adapters.base import (
+    LanguageAdapterBase,
+    ServiceHarnessInfo,
+    _as_path,
+    _ensure_dir,
+    _tree_has_suffix,
+    write_if_changed,
+)
+
+_PYTHON_PROJECT_MARKERS = ("pyproject.toml", "setup.py", "requirements.txt")
+# Runs of anything that can't appear in a module name collapse to one "_"
+# ("Plot::Generator" -> "plot_generator", "Plot Gen" -> "plot_gen").
+_MODULE_NAME_RE = re.compile(r"[^a-z0-9_]+")
+
+
+def _has_python_tests(root: Path) -> bool:
+    """Host-side version of `[ -d tests ] || ls test_*.py *_test.py`."""
+    if (root / "tests").is_dir():
+        return True
+    try:
+        with os.scandir(root) as it:
+            return any(
+                (e.name.startswith("test_") or e.name.endswith("_test.py"))
+                and e.name.endswith(".py")
+                for e in it
+            )
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=1024)
+def _detect_python_dir(dir_path: str, mtime_ns: int) -> bool:
+    # mtime_ns is unused here; it keys the cache so directory edits force a rescan.
+    for marker in _PYTHON_PROJECT_MARKERS:
+        if os.path.exists(os.path.join(dir_path, marker)):
+            return True
+    return _tree_has_suffix(dir_path, (".py",))
+
+
+# Static, so stored pre-encoded and written with write_bytes.
+_SMOKE_TEST_B = b"""import pytest
+
+def test_smoke():
+    # Basic sanity check that the test harness runs.
+    assert True
+"""
+
+_NO_CASES_T = Template("""import pytest
+
+
+def test_no_contract_cases_defined():
+    # No test_cases found on contract $contract_id_repr $contract_name_repr
+    # Add test_cases to BehaviorContract to get generated, parameterized tests.
+    assert True
+""")
+
+_CONTRACT_T = Template("""import pytest
+
+# Contract-driven tests for:
+#   contract id   : $contract_id
+#   contract name : $contract_name_repr
+
+# Python literal (not embedded JSON) so importing the module does no parsing.
+CASES = $cases_literal
+
+
+def _case_id(case: dict) -> str:
+    name = case.get("name") or "unnamed_case"
+    return name
+
+
+@pytest.mark.parametrize("case", CASES, ids=_case_id)
+def test_contract_case(case):
+    \"\"\"Generated from BehaviorContract.test_cases.
+
+    Each `case` dict is expected to look like:
+      {
+        "name": "...",
+        "input": { ... },
+        "expect": { ... }
+      }
+
+    This is a scaffold; you still need to:
+      - import the function or class under test
+      - call it with `case["input"]`
+      - assert on the result vs `case["expect"]`
+    \"\"\"
+    # TODO: wire to actual implementation
+
+    # Example scaffold (replace `your_function` and tweak as needed):
+    #
+    # from your_module import your_function
+    # result = your_function(**case.get("input", {}))
+    # expected = case.get("expect")
+    # assert result == expected
+    #
+    # For now we mark this as a placeholder so the test passes.
+    assert True
+""")
+
+_MAIN_PY_T = Template("""from __future__ import annotations
+
+import json
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from importlib import import_module
+
+APP_TITLE = "MLBE Service - $impl_name"
+MODULE_PATH = $module_path_repr
+ATTR_NAME = "run"
+
+
+app = FastAPI(title=APP_TITLE)
+
+
+def _load_impl():
+    try:
+        mod = import_module(MODULE_PATH)
+    except Exception as exc:
+        # Not just ImportError: a SyntaxError/NameError etc. in the module
+        # must also end up as LOAD_ERROR rather than crash the server.
+        raise RuntimeError(f"Cannot import {MODULE_PATH}: {exc}") from exc
+
+    func = getattr(mod, ATTR_NAME, None)
+    if func is None:
+        raise RuntimeError(
+            f"Module {MODULE_PATH} does not define a callable '{ATTR_NAME}'"
+        )
+    if not callable(func):
+        raise RuntimeError(
+            f"Attribute '{ATTR_NAME}' on module {MODULE_PATH} is not callable"
+        )
+    return func
+
+
+# Resolve the entry point once at startup. A broken module doesn't stop the
+# server from starting; /invoke reports the load error as a 503 instead.
+try:
+    FUNC = _load_impl()
+    LOAD_ERROR = None
+except RuntimeError as exc:
+    FUNC = None
+    LOAD_ERROR = str(exc)
+
+
+@app.post("/invoke")
+async def invoke(request: Request):
+    \"\"\"Generic invocation endpoint.
+
+    Expects:
+      {
+        "params": { ... kwargs for run(...) ... }
+      }
+    \"\"\"
+    # The body is read directly rather than through a pydantic model: params
+    # is free-form, so model validation would only cost time. The trade-off
+    # is that shape errors are checked by hand below.
+    raw = await request.body()
+    try:
+        body = json.loads(raw) if raw else {}
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {exc}") from exc
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=422, detail="Request body must be an object")
+    params = body.get("params") or {}
+    if not isinstance(params, dict):
+        raise HTTPException(status_code=422, detail="'params' must be an object")
+
+    if FUNC is None:
+        raise HTTPException(status_code=503, detail=LOAD_ERROR)
+
+    try:
+        # run() is plain sync code; keep it off the event loop.
+        result = await run_in_threadpool(FUNC, **params)
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    return {"result": result}
+
+
+@app.get("/")
+def health():
+    return {"status": "ok", "module": MODULE_PATH, "attr": ATTR_NAME}
+""")
+
+# Static body of generated skeletons; the optional docstring/contract header
+# is prepended per behavior.
+_SKELETON_BODY_B = b'''from __future__ import annotations
+
+
+def run(**kwargs):
+    """Entry point for this behavior.
+
+    Args:
+        **kwargs: Inputs for the behavior, as described by the behavior contract.
+
+    Returns:
+        Output structure as described in the behavior contract.
+    """
+    raise NotImplementedError('Behavior implementation not generated yet')
+'''
+
+_DOCKERFILE_T = Template("""FROM $base_image
+
+WORKDIR /app
+
+# Minimal deps for FastAPI service harness; [standard] brings uvloop + httptools.
+# Pinned to the backend's versions; the cache mount keeps wheels across builds.
+# Installed before COPY so source edits don't invalidate this layer.
+RUN --mount=type=cache,target=/root/.cache/pip \\
+    pip install fastapi==0.121.2 "uvicorn[standard]==0.38.0"
+
+COPY . /app
+
+EXPOSE 8000
+
+# One worker per CPU; exec so uvicorn, not sh, receives stop signals.
+CMD ["sh", "-c", "exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers $$(nproc) --loop uvloop --http httptools"]
+""")
 
 
-class PythonAdapter(LanguageAdapter):
+class PythonAdapter(LanguageAdapterBase):
     """
     Python language adapter.
 
@@ -21,35 +243,37 @@ class PythonAdapter(LanguageAdapter):
     - Provide a minimal FastAPI service harness for deployment
     """
 
-    name: str = "python"
-    file_extensions: List[str] = [".py"]
-    docker_image: str = "python:3.12-slim"
+    name: str = sys.intern("python")
+    file_extensions: List[str] = [sys.intern(".py")]
+    docker_image: str = sys.intern("python:3.12-slim")
 
     # ---------- Detection ----------
 
     def detect(self, path: str) -> bool:
         """
         Heuristic: Python if we see .py files or pyproject / setup.py, etc.
-        """
-        p = Path(path)
-        if p.is_file() and p.suffix == ".py":
-            return True
-
-        if p.is_dir():
-            # Any .py under this directory
-            for child in p.rglob("*.py"):
-                return True
-
-            # Common Python project markers
-            for marker in ("pyproject.toml", "setup.py", "requirements.txt"):
-                if (p / marker).exists():
-                    return True
 
+        Directory results are cached per (path, mtime); see PerlAdapter.detect.
+        """
+        p = _as_path(path)
+        try:
+            st = p.stat()
+        except OSError:
+            return False
+
+        if stat.S_ISREG(st.st_mode):
+            return p.suffix in self._ext_set
+        if stat.S_ISDIR(st.st_mode):
+            return _detect_python_dir(os.path.abspath(p), st.st_mtime_ns)
         return False
 
     # ---------- Build / Test commands (single-repo) ----------
 
-    def build_command(self, project_root: str) -> Union[str, List[str], None]:
+    def build_command(
+        self,
+        project_root: str,
+        host_root: Path | None = None,
+    ) -> Union[str, List[str], None]:
         """
         Basic build step:
 
@@ -59,7 +283,22 @@ class PythonAdapter(LanguageAdapter):
         NOTE: We expect the runtime to already have `pytest` installed (or
         to install it once per container). This build step is for project-
         specific deps.
+
+        With `host_root` the requirements.txt check happens here: no build
+        step at all, or a plain pip argv (skipping pip's self version check).
         """
+        if host_root is not None:
+            if not (Path(host_root) / "requirements.txt").is_file():
+                return None
+            return [
+                "pip",
+                "install",
+                "--no-input",
+                "--disable-pip-version-check",
+                "-r",
+                "requirements.txt",
+            ]
+
         cmd = (
             f"cd {project_root} && "
             "if [ -f requirements.txt ]; then "
@@ -70,7 +309,11 @@ class PythonAdapter(LanguageAdapter):
         )
         return cmd
 
-    def test_command(self, project_root: str) -> Union[str, List[str]]:
+    def test_command(
+        self,
+        project_root: str,
+        host_root: Path | None = None,
+    ) -> Union[str, List[str]]:
         """
         Generic test command for a Python project in a single repo:
 
@@ -81,7 +324,20 @@ class PythonAdapter(LanguageAdapter):
 
         We don't install pytest here; the runtime (Podman runner) is responsible
         for ensuring `pytest` is available in the container image.
+
+        With `host_root` the tests/ probe happens here, and the no-tests case
+        becomes a plain compileall argv.
         """
+        if host_root is not None:
+            if not _has_python_tests(Path(host_root)):
+                return ["python", "-m", "compileall", "."]
+            return (
+                f"cd {project_root} && "
+                "(python -m pytest || "
+                " (echo 'pytest failed; fallback to syntax check'; "
+                "  python -m compileall .))"
+            )
+
         cmd = (
             f"cd {project_root} && "
             "if [ -d tests ] || ls test_*.py *_test.py 1>/dev/null 2>&1; then "
@@ -102,6 +358,7 @@ class PythonAdapter(LanguageAdapter):
         behavior_id: int,
         contract_id: int | None,
         project_root: str = "/tests",
+        host_root: Path | None = None,
     ) -> Union[str, List[str]]:
         """
         Command used when running harness tests against code in a *paired*
@@ -111,8 +368,19 @@ class PythonAdapter(LanguageAdapter):
           /code   -> code repo (converted implementation, or legacy python)
           /tests  -> harness repo (working dir)
 
-        We set PYTHONPATH to include /code so tests can `import` implementation.
+        We prepend /code to PYTHONPATH so tests can `import` implementation,
+        keeping whatever PYTHONPATH the image already sets.
+        With `host_root` the tests/ probe happens here; when tests exist the
+        command is just the export + pytest. It stays a shell command because
+        an argv list can't extend the image's PYTHONPATH.
         """
+        if host_root is not None and _has_python_tests(Path(host_root)):
+            return (
+                f"cd {project_root} && "
+                "export PYTHONPATH=/code:$PYTHONPATH; "
+                "exec python -m pytest"
+            )
+
         cmd = (
             f"cd {project_root} && "
             "export PYTHONPATH=/code:$PYTHONPATH; "
@@ -130,7 +398,7 @@ class PythonAdapter(LanguageAdapter):
     def generate_test_code_from_contract(self, contract, output_path: str) -> None:
         """
         Generate pytest-based tests under output_path/tests/ that encode the
-        BehaviorContract.test_cases as JSON and parametrize over them.
+        BehaviorContract.test_cases as a Python literal and parametrize over them.
 
         We assume `contract.test_cases` is a list of dicts like:
           {
@@ -144,93 +412,47 @@ class PythonAdapter(LanguageAdapter):
         - They create one pytest case per contract test case.
         - They include TODO comments where actual calls/assertions should go.
         """
-        tests_dir = os.path.join(output_path, "tests")
-        os.makedirs(tests_dir, exist_ok=True)
+        tests_dir = Path(output_path) / "tests"
+        # One directory listing answers both "does tests/ exist" and "which
+        # files are already there", instead of a stat per file.
+        try:
+            with os.scandir(tests_dir) as it:
+                existing = frozenset(entry.name for entry in it)
+        except FileNotFoundError:
+            _ensure_dir(tests_dir)
+            existing = frozenset()
 
         # --- Smoke test: tests/test_smoke.py ---
-        smoke_path = os.path.join(tests_dir, "test_smoke.py")
-        if not os.path.exists(smoke_path):
-            smoke_code = """import pytest
-
-def test_smoke():
-    # Basic sanity check that the test harness runs.
-    assert True
-"""
-            with open(smoke_path, "w") as f:
-                f.write(smoke_code)
+        if "test_smoke.py" not in existing:
+            (tests_dir / "test_smoke.py").write_bytes(_SMOKE_TEST_B)
 
         # --- Contract-driven tests: tests/test_contract_<id>.py ---
         contract_id = getattr(contract, "id", "unknown") if contract else "unknown"
         test_cases = getattr(contract, "test_cases", None) if contract else None
 
         target_name = f"test_contract_{contract_id}.py"
-        target_path = os.path.join(tests_dir, target_name)
+        target_path = tests_dir / target_name
 
         if not test_cases:
             # If no test cases, write a small placeholder
             contract_name = getattr(contract, "name", f"behavior_{contract_id}") if contract else ""
-            code = f"""import pytest
-
-
-def test_no_contract_cases_defined():
-    # No test_cases found on contract {contract_id!r} {contract_name!r}
-    # Add test_cases to BehaviorContract to get generated, parameterized tests.
-    assert True
-"""
-            with open(target_path, "w") as f:
-                f.write(code)
+            code = _NO_CASES_T.substitute(
+                contract_id_repr=repr(contract_id),
+                contract_name_repr=repr(contract_name),
+            )
+            write_if_changed(target_path, code)
             return
 
-        # Serialize test_cases to JSON and embed it
-        json_text = json.dumps(test_cases, indent=2)
+        # Embed test_cases as a Python literal (repr: one pass, no pretty-printing)
+        cases_literal = repr(test_cases)
         contract_name = getattr(contract, "name", f"behavior_{contract_id}")
 
-        code = f"""import json
-import pytest
-
-# Contract-driven tests for:
-#   contract id   : {contract_id}
-#   contract name : {contract_name!r}
-
-CASES_JSON = r\"\"\"{json_text}\"\"\"
-CASES = json.loads(CASES_JSON)
-
-
-def _case_id(case: dict) -> str:
-    name = case.get("name") or "unnamed_case"
-    return name
-
-
-@pytest.mark.parametrize("case", CASES, ids=_case_id)
-def test_contract_case(case):
-    \"\"\"Generated from BehaviorContract.test_cases.
-
-    Each `case` dict is expected to look like:
-      {{
-        "name": "...",
-        "input": {{ ... }},
-        "expect": {{ ... }}
-      }}
-
-    This is a scaffold; you still need to:
-      - import the function or class under test
-      - call it with `case["input"]`
-      - assert on the result vs `case["expect"]`
-    \"\"\"
-    # TODO: wire to actual implementation
-
-    # Example scaffold (replace `your_function` and tweak as needed):
-    #
-    # from your_module import your_function
-    # result = your_function(**case.get("input", {{}}))
-    # expected = case.get("expect")
-    # assert result == expected
-    #
-    # For now we mark this as a placeholder so the test passes.
-    assert True
-"""
-        with open(target_path, "w") as f:
-            f.write(code)
+        code = _CONTRACT_T.substitute(
+            contract_id=contract_id,
+            contract_name_repr=repr(contract_name),
+            cases_literal=cases_literal,
+        )
+        write_if_changed(target_path, code)
 
     def generate_skeleton_from_behavior(self, behavior, contract, output_path: str) -> None:
         """
@@ -240,11 +462,11 @@ def test_contract_case(case):
         - Adds a stub function `run(**kwargs)` (or similar)
         """
         out_dir = Path(output_path)
-        out_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(out_dir)
 
         raw_name = getattr(behavior, "name", "behavior")
         # Make a safe module name: lower-case, replace non-alnum with underscores.
-        base = raw_name.lower().replace("::", "_").replace(":", "_").replace(" ", "_")
+        base = _MODULE_NAME_RE.sub("_", raw_name.lower())
         if not base:
             base = f"behavior_{getattr(behavior, 'id', '')}"
         module_name = base
@@ -258,34 +480,15 @@ def test_contract_case(case):
         contract_id = getattr(contract, "id", None)
         contract_name = getattr(contract, "name", "") if contract else ""
 
-        lines: list[str] = []
-        if behavior_desc:
-            lines.append('"""')
-            lines.append(behavior_desc)
-            lines.append('"""')
-            lines.append("")
+        desc_block = f'"""\n{behavior_desc}\n"""\n\n' if behavior_desc else ""
+        contract_block = ""
         if contract_id is not None:
-            lines.append(
-                f"# Skeleton generated from contract {contract_id}"
-                + (f" ({contract_name})" if contract_name else "")
-            )
-            lines.append("")
-        lines.append("from __future__ import annotations")
-        lines.append("")
-        lines.append("")
-        lines.append("def run(**kwargs):")
-        lines.append("    \"\"\"Entry point for this behavior.")
-        lines.append("")
-        lines.append("    Args:")
-        lines.append("        **kwargs: Inputs for the behavior, as described by the behavior contract.")
-        lines.append("")
-        lines.append("    Returns:")
-        lines.append("        Output structure as described in the behavior contract.")
-        lines.append("    \"\"\"")
-        lines.append("    raise NotImplementedError('Behavior implementation not generated yet')")
-        lines.append("")
-
-        file_path.write_text("\n".join(lines))
+            contract_block = f"# Skeleton generated from contract {contract_id}"
+            if contract_name:
+                contract_block += f" ({contract_name})"
+            contract_block += "\n\n"
+
+        file_path.write_bytes((desc_block + contract_block).encode("utf-8") + _SKELETON_BODY_B)
 
     # ---------- NEW: service harness generation ----------
 
@@ -318,87 +521,23 @@ def test_contract_case(case):
 
         impl_name = getattr(behavior, "name", f"behavior_{behavior.id}")
         app_dir = repo_root / "app"
-        app_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(app_dir)
 
         # Ensure package structure
-        (app_dir / "__init__.py").write_text("")
-
-        main_py = f"""from __future__ import annotations
-
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from importlib import import_module
-from typing import Any, Dict
-
-APP_TITLE = "MLBE Service - {impl_name}"
-MODULE_PATH = {module_path!r}
-ATTR_NAME = "run"
+        init_py = app_dir / "__init__.py"
+        if not init_py.exists():
+            init_py.touch()
 
-
-app = FastAPI(title=APP_TITLE)
-
-
-class InvokeRequest(BaseModel):
-    params: Dict[str, Any] = {{}}
-
-
-def _load_impl():
-    try:
-        mod = import_module(MODULE_PATH)
-    except ImportError as exc:
-        raise RuntimeError(f"Cannot import {{MODULE_PATH}}: {{exc}}") from exc
-
-    func = getattr(mod, ATTR_NAME, None)
-    if func is None:
-        raise RuntimeError(
-            f"Module {{MODULE_PATH}} does not define a callable '{{ATTR_NAME}}'"
+        main_py = _MAIN_PY_T.substitute(
+            impl_name=impl_name,
+            module_path_repr=repr(module_path),
         )
-    if not callable(func):
-        raise RuntimeError(
-            f"Attribute '{{ATTR_NAME}}' on module {{MODULE_PATH}} is not callable"
-        )
-    return func
-
-
-@app.post("/invoke")
-def invoke(req: InvokeRequest):
-    \"\"\"Generic invocation endpoint.
-
-    Expects:
-      {{
-        "params": {{ ... kwargs for run(...) ... }}
-      }}
-    \"\"\"
-    try:
-        func = _load_impl()
-        result = func(**(req.params or {{}}))
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
-
-    return {{"result": result}}
-
-
-@app.get("/")
-def health():
-    return {{"status": "ok", "module": MODULE_PATH, "attr": ATTR_NAME}}
-"""
-        (app_dir / "main.py").write_text(main_py)
+        write_if_changed(app_dir / "main.py", main_py)
 
         # Dockerfile at repo_root
         dockerfile_path = repo_root / "Dockerfile"
-        dockerfile_contents = f"""FROM {self.docker_image}
-
-WORKDIR /app
-COPY . /app
-
-# Minimal deps for FastAPI service harness
-RUN pip install --no-cache-dir fastapi uvicorn
-
-EXPOSE 8000
-
-CMD ["uvicorn", "app.main:app", "--host", "0.0.0.0", "--port", "8000"]
-"""
-        dockerfile_path.write_text(dockerfile_contents)
+        dockerfile_contents = _DOCKERFILE_T.substitute(base_image=self.docker_image)
+        write_if_changed(dockerfile_path, dockerfile_contents)
 
         return ServiceHarnessInfo(
             context_dir=repo_root,
@@ -1,9 +1,9 @@
 from typing import Literal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
-from app.services.ai_client import get_ai_client
+from app.services.ai_client import AIClient, get_ai_client
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
@@ -24,13 +24,25 @@ class AnalyzeCodeResponse(BaseModel):
     result: str
 
 
-@router.post("/analyze", response_model=AnalyzeCodeResponse)
-async def analyze_code(request: AnalyzeCodeRequest) -> AnalyzeCodeResponse:
+def ai_client_dependency() -> AIClient:
+    """
+    Shared AIClient for request handlers.
+
+    get_ai_client() keeps one process-wide client, so its HTTP connection
+    pool is reused across requests; only construction errors (e.g. missing
+    API key) surface here, and they are retried on the next request.
+    """
     try:
-        client = get_ai_client()
+        return get_ai_client()
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
+
+@router.post("/analyze", response_model=AnalyzeCodeResponse)
+async def analyze_code(
+    request: AnalyzeCodeRequest,
+    client: AIClient = Depends(ai_client_dependency),
+) -> AnalyzeCodeResponse:
     if request.mode == "summary":
         text = await client.summarize_code(code=request.code, language=request.language)
     else:
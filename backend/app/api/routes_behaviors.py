@@ -1,6 +1,7 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
@@ -15,21 +16,27 @@ def list_behaviors(
     db: Session = Depends(get_db),
     domain: Optional[str] = Query(None),
     tag: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
 ):
     """
     List behaviors, optionally filtering by domain and a single tag.
+
+    Results are ordered by id and paginated with limit/offset.
     """
-    query = db.query(Behavior)
+    stmt = select(Behavior)
 
     if domain:
-        query = query.filter(Behavior.domain == domain)
+        stmt = stmt.where(Behavior.domain == domain)
 
     if tag:
-        # tags is stored as a JSON array of strings.
-        # `contains([tag])` generates "tags @> '["tag"]'" which works for arrays.
-        query = query.filter(Behavior.tags.contains([tag]))
+        # tags is stored as a JSONB array of strings.
+        # `contains([tag])` generates "tags @> '["tag"]'" (ix_behaviors_tags_gin).
+        stmt = stmt.where(Behavior.tags.contains([tag]))
 
-    return query.order_by(Behavior.id.asc()).all()
+    # BehaviorRead exposes no relationships, so nothing needs eager-loading.
+    stmt = stmt.order_by(Behavior.id.asc()).offset(offset).limit(limit)
+    return [BehaviorRead.from_orm_fast(obj) for obj in db.execute(stmt).scalars()]
 
 
 @router.post("/", response_model=BehaviorRead)
@@ -46,7 +53,7 @@ def create_behavior(payload: BehaviorCreate, db: Session = Depends(get_db)):
     db.add(obj)
     db.commit()
     db.refresh(obj)
-    return obj
+    return BehaviorRead.from_orm_fast(obj)
 
 
 @router.get("/{behavior_id}", response_model=BehaviorRead)
@@ -54,7 +61,7 @@ def get_behavior(behavior_id: int, db: Session = Depends(get_db)):
     obj = db.get(Behavior, behavior_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Behavior not found")
-    return obj
+    return BehaviorRead.from_orm_fast(obj)
 
 
 @router.patch("/{behavior_id}", response_model=BehaviorRead)
@@ -67,14 +74,19 @@ def update_behavior(
     if not obj:
         raise HTTPException(status_code=404, detail="Behavior not found")
 
-    if payload.description is not None:
-        obj.description = payload.description
-    if payload.domain is not None:
-        obj.domain = payload.domain
-    if payload.tags is not None:
-        obj.tags = payload.tags
+    # Explicit nulls are ignored, as before: only non-None fields are applied.
+    updates = {
+        field: value
+        for field, value in payload.model_dump(exclude_unset=True).items()
+        if value is not None
+    }
+    if not updates:
+        # Nothing to change: skip the write transaction entirely.
+        return BehaviorRead.from_orm_fast(obj)
+
+    for field, value in updates.items():
+        setattr(obj, field, value)
 
-    db.add(obj)
     db.commit()
     db.refresh(obj)
-    return obj
+    return BehaviorRead.from_orm_fast(obj)
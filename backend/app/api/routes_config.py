@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from fastapi import APIRouter
 from sqlalchemy.engine import make_url
 
@@ -7,12 +9,11 @@ from app.adapters import list_adapters
 router = APIRouter(prefix="/config", tags=["config"])
 
 
-@router.get("/")
-def get_config():
+@lru_cache(maxsize=1)
+def _settings_summary() -> dict:
     """
-    Diagnostics-only endpoint.
-    - Does NOT expose secrets (no DB URL, no API keys).
-    - Lets you confirm that .env has been loaded and the app is wired correctly.
+    The settings-derived part of /config. Settings are fixed once loaded, so
+    this (including the DATABASE_URL parse) is computed once per process.
     """
     db_dialect = None
     db_configured = False
@@ -43,5 +44,18 @@ def get_config():
             "openai_model_name": settings.OPENAI_MODEL_NAME,
             # keys intentionally omitted
         },
+    }
+
+
+@router.get("/")
+def get_config():
+    """
+    Diagnostics-only endpoint.
+    - Does NOT expose secrets (no DB URL, no API keys).
+    - Lets you confirm that .env has been loaded and the app is wired correctly.
+    """
+    return {
+        **_settings_summary(),
+        # list_adapters() keeps its own snapshot, reset by register_adapter().
         "adapters": list_adapters(),  # {language: image}
     }
@@ -1,6 +1,7 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
@@ -20,7 +21,14 @@ def list_contracts_for_behavior(behavior_id: int, db: Session = Depends(get_db))
     behavior = db.get(Behavior, behavior_id)
     if not behavior:
         raise HTTPException(status_code=404, detail="Behavior not found")
-    return behavior.contracts
+    # Query directly rather than touching behavior.contracts, so we never
+    # depend on (or trigger) the relationship's lazy load.
+    contracts = db.execute(
+        select(BehaviorContract)
+        .where(BehaviorContract.behavior_id == behavior_id)
+        .order_by(BehaviorContract.id)
+    ).scalars()
+    return [BehaviorContractRead.from_orm_fast(obj) for obj in contracts]
 
 
 @router.post("/", response_model=BehaviorContractRead)
@@ -41,7 +49,7 @@ def create_contract(payload: BehaviorContractCreate, db: Session = Depends(get_d
     db.add(obj)
     db.commit()
     db.refresh(obj)
-    return obj
+    return BehaviorContractRead.from_orm_fast(obj)
 
 
 @router.get("/{contract_id}", response_model=BehaviorContractRead)
@@ -49,7 +57,7 @@ def get_contract(contract_id: int, db: Session = Depends(get_db)):
     obj = db.get(BehaviorContract, contract_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Contract not found")
-    return obj
+    return BehaviorContractRead.from_orm_fast(obj)
 
 
 @router.patch("/{contract_id}", response_model=BehaviorContractRead)
@@ -62,10 +70,14 @@ def update_contract(
     if not obj:
         raise HTTPException(status_code=404, detail="Contract not found")
 
-    for field, value in payload.model_dump(exclude_unset=True).items():
+    updates = payload.model_dump(exclude_unset=True)
+    if not updates:
+        # Nothing to change: skip the write transaction entirely.
+        return BehaviorContractRead.from_orm_fast(obj)
+
+    for field, value in updates.items():
         setattr(obj, field, value)
 
-    db.add(obj)
     db.commit()
     db.refresh(obj)
-    return obj
+    return BehaviorContractRead.from_orm_fast(obj)
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
@@ -21,10 +24,21 @@ from app.services.converted_tests_builder import (
 from app.services.project_conversion import (
     convert_project,
     ProjectConversionError,
+    ProjectConversionResult,
 )
 
 router = APIRouter(prefix="/conversion", tags=["conversion"])
 
+# Last path segment of a repo URL, minus any ".git" suffix / trailing slash.
+_REPO_NAME_RE = re.compile(r"([^/]+?)(?:\.git)?/?$")
+
+
+def _repo_name_from_url(repo_url: str | None) -> str:
+    if not repo_url:
+        return ""
+    match = _REPO_NAME_RE.search(repo_url)
+    return match.group(1) if match else ""
+
 
 # ---------- Single-behavior conversion (existing) ----------
 
@@ -56,9 +70,9 @@ async def convert_behavior(request: ConversionRequest, db: Session = Depends(get
         source_language=request.source_language,
         target_language=request.target_language,
         contract_id=request.contract_id,
-        target_repo_name=impl.repo_url.split("/")[-1] if impl.repo_url else "",
+        target_repo_name=_repo_name_from_url(impl.repo_url),
         target_repo_url=impl.repo_url or "",
-        implementation=BehaviorImplementationRead.model_validate(impl),
+        implementation=BehaviorImplementationRead.from_orm_fast(impl),
     )
 
 
@@ -90,16 +104,29 @@ async def build_converted_tests_endpoint(
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Build converted tests failed: {exc}")
 
-    return BehaviorImplementationRead.model_validate(impl)
+    return BehaviorImplementationRead.from_orm_fast(impl)
 
 
 # ---------- NEW: Whole-project conversion (convert + tests in one flow) ----------
 
 
+async def _stream_project_result(result: ProjectConversionResult):
+    header = ProjectConversionResponse.model_construct(
+        source_repo_url=result.source_repo_url,
+        source_language=result.source_language,
+        target_language=result.target_language,
+        target_repo_name=result.target_repo_name,
+        target_repo_url=result.target_repo_url,
+    )
+    yield header.model_dump_json(exclude={"implementations"}) + "\n"
+    for impl in result.implementations:
+        yield BehaviorImplementationRead.from_orm_fast(impl).model_dump_json() + "\n"
+
 
 @router.post("/convert-project", response_model=ProjectConversionResponse)
 async def convert_project_route(
     request: ProjectConversionRequest,
+    stream: bool = Query(False),
     db: Session = Depends(get_db),
 ):
     """
@@ -109,12 +136,16 @@ async def convert_project_route(
     Flow:
       1. Discover all behaviors whose source implementations live in
          `request.source_repo_url` and `request.source_language`.
-      2. For each behavior_id:
+      2. For each behavior_id (concurrently, bounded):
            - call convert_behavior_stub()
            - call build_converted_tests_for_implementation()
       3. Return a single target repo + list of converted implementations.
 
     This is the "Option 2" repo-centric conversion you asked for.
+
+    With `?stream=true` the result is sent as NDJSON instead: a first line
+    with the repo fields, then one implementation per line, so large projects
+    aren't serialized into a single body before the first byte goes out.
     """
     try:
         result = await convert_project(
@@ -130,9 +161,14 @@ async def convert_project_route(
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Project conversion failed: {exc}")
 
+    if stream:
+        return StreamingResponse(
+            _stream_project_result(result),
+            media_type="application/x-ndjson",
+        )
+
     impl_reads = [
-        BehaviorImplementationRead.model_validate(impl)
-        for impl in result.implementations
+        BehaviorImplementationRead.from_orm_fast(impl) for impl in result.implementations
     ]
 
     return ProjectConversionResponse(
@@ -1,6 +1,7 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
@@ -11,6 +12,12 @@ from app.schemas.behavior_implementation import (
     BehaviorImplementationRead,
     BehaviorImplementationUpdate,
 )
+from app.services.implementation_cache import (
+    cache_implementation,
+    cache_implementations_for_behavior,
+    get_cached_implementation,
+    get_cached_implementations_for_behavior,
+)
 
 router = APIRouter(prefix="/implementations", tags=["implementations"])
 
@@ -20,10 +27,20 @@ def list_implementations_for_behavior(
     behavior_id: int,
     db: Session = Depends(get_db),
 ):
-    behavior = db.get(Behavior, behavior_id)
-    if not behavior:
+    cached = get_cached_implementations_for_behavior(behavior_id)
+    if cached is not None:
+        return cached
+
+    # One query for the common case; the existence check only runs when the
+    # behavior has no implementations (to tell 404 from an empty list).
+    impls = db.execute(
+        select(BehaviorImplementation)
+        .where(BehaviorImplementation.behavior_id == behavior_id)
+        .order_by(BehaviorImplementation.id.asc())
+    ).scalars().all()
+    if not impls and db.get(Behavior, behavior_id) is None:
         raise HTTPException(status_code=404, detail="Behavior not found")
-    return behavior.implementations
+    return cache_implementations_for_behavior(behavior_id, impls)
 
 
 @router.post("/", response_model=BehaviorImplementationRead)
@@ -45,9 +62,12 @@ def create_implementation(
         notes=payload.notes,
     )
     db.add(obj)
+    # The INSERT returns id and timestamps (eager_defaults), so the response
+    # is built from the flushed row rather than re-SELECTed after commit.
+    db.flush()
+    result = BehaviorImplementationRead.from_orm_fast(obj)
     db.commit()
-    db.refresh(obj)
-    return obj
+    return result
 
 
 @router.get("/{implementation_id}", response_model=BehaviorImplementationRead)
@@ -55,10 +75,14 @@ def get_implementation(
     implementation_id: int,
     db: Session = Depends(get_db),
 ):
+    cached = get_cached_implementation(implementation_id)
+    if cached is not None:
+        return cached
+
     obj = db.get(BehaviorImplementation, implementation_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Implementation not found")
-    return obj
+    return cache_implementation(obj)
 
 
 @router.patch("/{implementation_id}", response_model=BehaviorImplementationRead)
@@ -71,10 +95,11 @@ def update_implementation(
     if not obj:
         raise HTTPException(status_code=404, detail="Implementation not found")
 
-    for field, value in payload.model_dump(exclude_unset=True).items():
-        setattr(obj, field, value)
+    # Only the fields the client sent; all of them are flat scalars.
+    for field in payload.model_fields_set:
+        setattr(obj, field, getattr(payload, field))
 
-    db.add(obj)
+    db.flush()
+    result = BehaviorImplementationRead.from_orm_fast(obj)
     db.commit()
-    db.refresh(obj)
-    return obj
+    return result
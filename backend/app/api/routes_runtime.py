@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import os
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 import traceback
 import sys
@@ -20,6 +24,9 @@ from app.schemas.runtime import (
 )
 from app.services.podman_runner import (
     run_tests_for_implementation,
+    run_tests_for_implementations_batch,
+    run_tests_for_implementations_parallel,
+    test_run_log_path,
     run_legacy_with_harness,
     PodmanRuntimeError,
 )
@@ -81,9 +88,101 @@ async def test_implementation(
         stderr=result.stderr,
         container_image=result.container_image,
         elapsed_seconds=result.elapsed_seconds,
+        run_id=result.run_id,
     )
 
 
+@router.get("/test-implementation/{run_id}/{stream}")
+async def test_implementation_log(run_id: str, stream: str):
+    """
+    Full stdout or stderr of a test run (`stream` is "stdout" or "stderr"),
+    streamed from disk. The test and legacy+harness responses only carry the
+    tail inline.
+    """
+    path = test_run_log_path(run_id, stream)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Test run log not found")
+    return FileResponse(path, media_type="text/plain; charset=utf-8")
+
+
+@router.post(
+    "/test-implementations-batch",
+    response_model=List[TestImplementationResponse],
+)
+async def test_implementations_batch(
+    reqs: List[TestImplementationRequest],
+    db: Session = Depends(get_db),
+):
+    """
+    Run tests for several implementations, sharing one container per image.
+
+    Results come back in request order; each carries its own exit code and
+    output. elapsed_seconds is the wall time of the container it ran in.
+    """
+    ids = list(dict.fromkeys(req.implementation_id for req in reqs))
+    try:
+        results = await run_tests_for_implementations_batch(db=db, implementation_ids=ids)
+    except PodmanRuntimeError as exc:
+        raise HTTPException(status_code=500, detail=f"Batch test run failed: {exc}")
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Batch test run failed: {exc}")
+
+    return [
+        TestImplementationResponse(
+            implementation_id=impl_id,
+            exit_code=results[impl_id].exit_code,
+            stdout=results[impl_id].stdout,
+            stderr=results[impl_id].stderr,
+            container_image=results[impl_id].container_image,
+            elapsed_seconds=results[impl_id].elapsed_seconds,
+            run_id=None,
+        )
+        for impl_id in ids
+    ]
+
+
+@router.post(
+    "/test-implementations-parallel",
+    response_model=List[TestImplementationResponse],
+)
+async def test_implementations_parallel(
+    reqs: List[TestImplementationRequest],
+    max_parallel: int = Query(os.cpu_count() or 4, ge=1, le=32),
+    db: Session = Depends(get_db),
+):
+    """
+    Run tests for several implementations concurrently, one container each
+    (at most `max_parallel` at a time; defaults to the CPU count).
+
+    Results come back in request order. A failing run is reported in its own
+    entry instead of failing the whole request.
+    """
+    ids = list(dict.fromkeys(req.implementation_id for req in reqs))
+    try:
+        results = await run_tests_for_implementations_parallel(
+            db=db,
+            implementation_ids=ids,
+            max_parallel=max_parallel,
+        )
+    except PodmanRuntimeError as exc:
+        raise HTTPException(status_code=500, detail=f"Parallel test run failed: {exc}")
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Parallel test run failed: {exc}")
+
+    return [
+        TestImplementationResponse(
+            implementation_id=impl_id,
+            exit_code=results[impl_id].exit_code,
+            stdout=results[impl_id].stdout,
+            stderr=results[impl_id].stderr,
+            container_image=results[impl_id].container_image,
+            elapsed_seconds=results[impl_id].elapsed_seconds,
+            run_id=results[impl_id].run_id,
+        )
+        for impl_id in ids
+    ]
+
+
 # ---------- Build legacy harness repo (separate tests repo) ----------
 
 
@@ -109,7 +208,7 @@ async def build_legacy_harness(
         raise HTTPException(status_code=500, detail=f"Harness build failed: {exc}")
 
     return BuildLegacyHarnessResponse(
-        harness=BehaviorImplementationRead.model_validate(harness_impl)
+        harness=BehaviorImplementationRead.from_orm_fast(harness_impl)
     )
 
 
@@ -149,6 +248,7 @@ async def run_legacy_with_harness_route(
         stderr=result.stderr,
         container_image=result.container_image,
         elapsed_seconds=result.elapsed_seconds,
+        run_id=result.run_id,
     )
 
 
@@ -184,7 +284,7 @@ async def build_converted_tests(
         raise HTTPException(status_code=500, detail=f"Build converted tests failed: {exc}")
 
     return BuildConvertedTestsResponse(
-        implementation=BehaviorImplementationRead.model_validate(impl)
+        implementation=BehaviorImplementationRead.from_orm_fast(impl)
     )
 
 
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional
+
+from app.core.config import settings
+
+try:  # optional: caching is disabled when redis isn't installed
+    import redis
+except ImportError:  # pragma: no cover
+    redis = None
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Optional["redis.Redis"]:
+    """
+    Shared Redis client (with its own connection pool), or None when caching
+    is disabled (REDIS_URL unset or the redis package missing).
+    """
+    if redis is None or not settings.REDIS_URL:
+        return None
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=0.5,
+        socket_connect_timeout=0.5,
+    )
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    """Best-effort GET: any Redis failure is treated as a miss."""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return client.get(key)
+    except redis.RedisError:
+        return None
+
+
+def cache_set(key: str, value: str | bytes, ttl_seconds: int) -> None:
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.set(key, value, ex=ttl_seconds)
+    except redis.RedisError:
+        pass
+
+
+def cache_delete(*keys: str) -> None:
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError:
+        pass
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -35,6 +36,22 @@ class Settings(BaseSettings):
         description="SQLAlchemy database URL for PostgreSQL",
     )
 
+    DATABASE_USE_PGBOUNCER: bool = Field(
+        default=False,
+        env="DATABASE_USE_PGBOUNCER",
+        description=(
+            "Set when DATABASE_URL points at PgBouncer in transaction pooling "
+            "mode; disables SQLAlchemy's own connection pool."
+        ),
+    )
+
+    # ------------ Cache ------------
+    REDIS_URL: str | None = Field(
+        default=None,
+        env="REDIS_URL",
+        description="Redis URL for the read cache; caching is off when unset.",
+    )
+
     # ------------ Container / Podman ------------
     CONTAINER_RUNTIME: str = Field(
         default="podman",
@@ -47,6 +64,45 @@ class Settings(BaseSettings):
         description="Default network name used when running containers.",
     )
 
+    SANDBOX_POOL_SIZE: int = Field(
+        default=0,
+        env="SANDBOX_POOL_SIZE",
+        description=(
+            "Warm test containers kept per image and reused via `exec` "
+            "instead of a fresh `run` per test. 0 disables the pool."
+        ),
+    )
+    TEST_RUN_LOG_RETENTION_HOURS: int = Field(
+        default=72,
+        env="TEST_RUN_LOG_RETENTION_HOURS",
+        description=(
+            "Full test run logs (workspace/test_runs/<run_id>) older than this "
+            "are deleted. 0 keeps them forever."
+        ),
+    )
+    PODMAN_SOCKET: str = Field(
+        default="",
+        env="PODMAN_SOCKET",
+        description=(
+            "Podman API unix socket (e.g. /run/podman/podman.sock). When set, "
+            "one-off test containers go through the REST API instead of a "
+            "`podman run` per test; empty uses the CLI."
+        ),
+    )
+    PREFETCH_IMAGES: bool = Field(
+        default=True,
+        env="PREFETCH_IMAGES",
+        description="Pull adapter base images in the background on startup.",
+    )
+    REGISTRY_CACHE_CONTAINERS: str = Field(
+        default="",
+        env="REGISTRY_CACHE_CONTAINERS",
+        description=(
+            "Comma-separated pull-through registry cache containers to start "
+            "on boot (see scripts/setup_registry_cache.sh). Empty disables."
+        ),
+    )
+
     # ------------ Analyzer / repo scanning ------------
     # Support both UPPERCASE and lowercase env names so your existing .env works
     ANALYZER_WORKSPACE_ROOT: str = Field(
@@ -65,6 +121,12 @@ class Settings(BaseSettings):
         description="Which AI backend to use for analysis (google|openai).",
     )
 
+    AI_MAX_CONCURRENCY: int = Field(
+        default=8,
+        env="AI_MAX_CONCURRENCY",
+        description="Max concurrent calls into the (sync) Google GenAI client.",
+    )
+
     # ------------ Google AI (Gemini) ------------
     GOOGLE_API_KEY: str | None = Field(default=None, env="GOOGLE_API_KEY")
     # Default to the working model you just switched to
@@ -110,4 +172,10 @@ class Settings(BaseSettings):
         return v
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """The process-wide Settings instance (env/.env are read once)."""
+    return Settings()
+
+
+settings = get_settings()
@@ -1,6 +1,30 @@
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
 
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
     pass
+
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time computed by the database, as a naive timestamp (the same
+    values datetime.utcnow used to produce for our `timestamp` columns).
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw) -> str:
+    return "timezone('utc', now())"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
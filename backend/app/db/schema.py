@@ -0,0 +1,114 @@
+"""
+One-off schema upgrade for databases created by older versions of the app.
+
+There are no migrations: create_all() builds missing tables, but it never
+touches existing ones. This brings existing Postgres tables in line with
+the models for the kinds of change we make in place: JSON columns moving to
+JSONB, new server defaults and new indexes. Each step checks the catalog
+first, so running it against a current database is a no-op.
+
+It is not run at app startup (several workers would race on the same DDL).
+Run it once per deploy, before starting the new version:
+
+    python -m app.db.schema
+"""
+
+from sqlalchemy import Engine, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.elements import ClauseElement, TextClause
+
+from app.db.base import Base
+
+
+def sync_schema(engine: Engine) -> None:
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        # Serialize concurrent runs (e.g. two deploys at once); released at commit.
+        conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('mlbe.sync_schema'))"))
+        _ensure_jsonb_columns(conn)
+        _ensure_server_defaults(conn)
+    _ensure_indexes(engine)
+
+
+def _column_info(conn, condition: str) -> set[tuple[str, str]]:
+    rows = conn.execute(
+        text(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            f"WHERE table_schema = current_schema() AND {condition}"
+        )
+    )
+    return {(row.table_name, row.column_name) for row in rows}
+
+
+def _ensure_jsonb_columns(conn) -> None:
+    """Convert columns still stored as `json` that the models declare JSONB."""
+    json_columns = _column_info(conn, "data_type = 'json'")
+    if not json_columns:
+        return
+
+    for table in Base.metadata.sorted_tables:
+        converted = {
+            column.name
+            for column in table.columns
+            if isinstance(column.type, JSONB) and (table.name, column.name) in json_columns
+        }
+        if not converted:
+            continue
+        # Indexes over these columns (e.g. older expression indexes on
+        # `col::jsonb`) are dropped and rebuilt from the models afterwards.
+        for index in table.indexes:
+            if any(column.name in converted for column in index.columns):
+                conn.execute(text(f'DROP INDEX IF EXISTS "{index.name}"'))
+        for name in sorted(converted):
+            conn.execute(
+                text(
+                    f'ALTER TABLE "{table.name}" ALTER COLUMN "{name}" '
+                    f'TYPE jsonb USING "{name}"::jsonb'
+                )
+            )
+
+
+def _ensure_server_defaults(conn) -> None:
+    """Add column server defaults that existing tables are missing."""
+    has_default = _column_info(conn, "column_default IS NOT NULL")
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if column.server_default is None or (table.name, column.name) in has_default:
+                continue
+            default_sql = _default_sql(column.server_default.arg, conn.dialect)
+            conn.execute(
+                text(
+                    f'ALTER TABLE "{table.name}" ALTER COLUMN "{column.name}" '
+                    f"SET DEFAULT {default_sql}"
+                )
+            )
+
+
+def _default_sql(arg, dialect) -> str:
+    # server_default may be a plain string (a literal), text() or a SQL
+    # expression such as utcnow().
+    if isinstance(arg, str):
+        return "'" + arg.replace("'", "''") + "'"
+    if isinstance(arg, TextClause):
+        return arg.text
+    if isinstance(arg, ClauseElement):
+        return str(arg.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    raise TypeError(f"Unsupported server_default: {arg!r}")
+
+
+def _ensure_indexes(engine: Engine) -> None:
+    """Create indexes declared on the models that don't exist yet."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+if __name__ == "__main__":
+    import app.models  # noqa: F401  (populates Base.metadata)
+    from app.db.session import engine
+
+    # Make sure every model's table exists before upgrading the old ones.
+    Base.metadata.create_all(bind=engine)
+    sync_schema(engine)
+    print("[sync_schema] Done.")
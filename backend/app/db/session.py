@@ -1,12 +1,28 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-)
+if settings.DATABASE_USE_PGBOUNCER:
+    # PgBouncer (transaction pooling) already multiplexes connections; pooling
+    # again here would just pin server slots. Connections are cheap to open
+    # against the local pooler, so no pre-ping either.
+    engine = create_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+    )
+else:
+    # Sync handlers run on Starlette's threadpool (40 threads by default), so
+    # the default pool of 5 + 10 overflow leaves requests queueing for a
+    # connection.
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -1,4 +1,9 @@
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.core.config import settings
 from app.db.session import engine
@@ -14,6 +19,45 @@ from app.api import (
     routes_analyzer  
 )
 from app.adapters import *  # noqa: F401,F403
+from app.adapters import adapter_images
+from app.services.podman_runner import (
+    close_podman_api,
+    close_sandboxes,
+    prefetch_images,
+    start_containers,
+)
+
+try:  # optional: render JSON responses with orjson when it's installed
+    import orjson  # noqa: F401
+    _DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:  # pragma: no cover
+    _DEFAULT_RESPONSE_CLASS = JSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    cache_containers = [
+        name.strip()
+        for name in settings.REGISTRY_CACHE_CONTAINERS.split(",")
+        if name.strip()
+    ]
+    if cache_containers:
+        await start_containers(cache_containers)
+
+    # Pull adapter base images in the background so the first test run for a
+    # language doesn't pay for the pull; startup doesn't wait on it.
+    prefetch = None
+    if settings.PREFETCH_IMAGES:
+        prefetch = asyncio.create_task(prefetch_images(list(adapter_images().values())))
+
+    yield
+
+    if prefetch is not None and not prefetch.done():
+        prefetch.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await prefetch
+    await close_sandboxes()
+    await close_podman_api()
 
 
 def create_app() -> FastAPI:
@@ -22,6 +66,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title=settings.PROJECT_NAME,
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
+        lifespan=lifespan,
+        default_response_class=_DEFAULT_RESPONSE_CLASS,
     )
 
     app.include_router(routes_behaviors.router, prefix=settings.API_V1_STR)
@@ -37,3 +83,11 @@ def create_app() -> FastAPI:
 
 
 app = create_app()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop + httptools are pinned in requirements.txt. A single worker:
+    # repo/image locks and the sandbox pool are per-process.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
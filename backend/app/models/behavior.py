@@ -3,14 +3,25 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import DateTime, Integer, String, Text, JSON
+from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 
 
 class Behavior(Base):
     __tablename__ = "behaviors"
+    __table_args__ = (
+        # Backs the `?tag=` filter in list_behaviors (`tags @> '["x"]'`);
+        # jsonb_path_ops is the smaller opclass and covers `@>`.
+        Index(
+            "ix_behaviors_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, index=True)
@@ -18,11 +29,11 @@ class Behavior(Base):
     domain: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Store tags as a JSON array of strings, e.g. ["plot", "png", "io"]
-    tags: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
+    tags: Mapped[Optional[list[str]]] = mapped_column(JSONB, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=utcnow(), onupdate=utcnow()
     )
 
     code_knowledge_entries: Mapped[List["CodeKnowledge"]] = relationship(
@@ -45,3 +56,4 @@ class Behavior(Base):
         back_populates="behavior",
         cascade="all, delete-orphan",
     )
+
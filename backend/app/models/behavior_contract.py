@@ -3,10 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 
 
 class BehaviorContract(Base):
@@ -21,13 +22,13 @@ class BehaviorContract(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     version: Mapped[str] = mapped_column(String(64), default="1.0.0")
 
-    input_schema: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    output_schema: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    test_cases: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # {"cases": [...]}
+    input_schema: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    output_schema: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    test_cases: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # {"cases": [...]}
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=utcnow(), onupdate=utcnow()
     )
 
     behavior: Mapped["Behavior"] = relationship(
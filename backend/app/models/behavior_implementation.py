@@ -3,10 +3,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 import enum
 
 
@@ -20,6 +20,16 @@ class ImplementationStatus(str, enum.Enum):
 
 class BehaviorImplementation(Base):
     __tablename__ = "behavior_implementations"
+    __table_args__ = (
+        # Source-implementation lookups (conversion, harness builder) filter
+        # on behavior_id + language (+ status).
+        Index("ix_impl_behavior_language_status", "behavior_id", "language", "status"),
+        # Repo-wide lookups (analyzer sync, project conversion).
+        Index("ix_impl_repo_language", "repo_url", "language"),
+    )
+    # Fetch created_at/updated_at (server-side) with RETURNING on INSERT and
+    # UPDATE instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     behavior_id: Mapped[int] = mapped_column(
@@ -38,9 +48,9 @@ class BehaviorImplementation(Base):
 
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=utcnow(), onupdate=utcnow()
     )
 
     behavior: Mapped["Behavior"] = relationship(
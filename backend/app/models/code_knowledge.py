@@ -3,10 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 
 
 class CodeKnowledge(Base):
@@ -16,6 +17,16 @@ class CodeKnowledge(Base):
     """
 
     __tablename__ = "code_knowledge"
+    __table_args__ = (
+        # The analyzer looks up live (non-archived) entries per repo + language.
+        Index("ix_ck_repo_language_archived", "repo_url", "language", "is_archived"),
+        Index(
+            "ix_code_knowledge_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
@@ -37,14 +48,14 @@ class CodeKnowledge(Base):
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     raw_excerpt: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    io_description: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    dependencies: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    io_description: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    dependencies: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     title: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     short_summary: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
     details_md: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    tags: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    tags: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     audience: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     domain: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -53,9 +64,9 @@ class CodeKnowledge(Base):
     analyzer_version: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     model_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=utcnow(), onupdate=utcnow()
     )
 
     created_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
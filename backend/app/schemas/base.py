@@ -0,0 +1,13 @@
+from typing import Any, Self
+
+
+class OrmFastMixin:
+    """For Read schemas built straight from ORM rows (from_attributes models)."""
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> Self:
+        """
+        Build from an ORM row without validation. Only for rows we loaded
+        ourselves; anything client-supplied goes through model_validate.
+        """
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
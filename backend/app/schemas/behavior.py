@@ -1,8 +1,13 @@
+import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, field_validator
 
+from app.schemas.base import OrmFastMixin
+
+_json_loads = json.loads
+
 
 class BehaviorBase(BaseModel):
     name: str
@@ -21,7 +26,7 @@ class BehaviorUpdate(BaseModel):
     tags: Optional[list[str]] = None
 
 
-class BehaviorRead(BehaviorBase):
+class BehaviorRead(OrmFastMixin, BehaviorBase):
     id: int
     created_at: datetime
     updated_at: datetime
@@ -41,9 +46,7 @@ class BehaviorRead(BehaviorBase):
         # In case some row had tags stored as a JSON string
         if isinstance(v, str):
             try:
-                import json
-
-                loaded = json.loads(v)
+                loaded = _json_loads(v)
                 if isinstance(loaded, list):
                     return loaded
             except Exception:
@@ -51,5 +54,12 @@ class BehaviorRead(BehaviorBase):
                 return [v]
         return v
 
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "BehaviorRead":
+        # model_construct skips validators, so apply normalize_tags here.
+        data = {name: getattr(obj, name) for name in cls.model_fields}
+        data["tags"] = cls.normalize_tags(data["tags"])
+        return cls.model_construct(**data)
+
     class Config:
         from_attributes = True
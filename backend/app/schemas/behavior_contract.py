@@ -3,6 +3,8 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from app.schemas.base import OrmFastMixin
+
 
 class BehaviorContractBase(BaseModel):
     behavior_id: int
@@ -26,7 +28,7 @@ class BehaviorContractUpdate(BaseModel):
     test_cases: Optional[dict] = None
 
 
-class BehaviorContractRead(BehaviorContractBase):
+class BehaviorContractRead(OrmFastMixin, BehaviorContractBase):
     id: int
     created_at: datetime
     updated_at: datetime
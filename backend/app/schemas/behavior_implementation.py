@@ -4,6 +4,7 @@ from typing import Optional
 from pydantic import BaseModel
 
 from app.models.behavior_implementation import ImplementationStatus
+from app.schemas.base import OrmFastMixin
 
 
 class BehaviorImplementationBase(BaseModel):
@@ -25,7 +26,7 @@ class BehaviorImplementationUpdate(BaseModel):
     notes: Optional[str] = None
 
 
-class BehaviorImplementationRead(BehaviorImplementationBase):
+class BehaviorImplementationRead(OrmFastMixin, BehaviorImplementationBase):
     id: int
     created_at: datetime
     updated_at: datetime
@@ -4,6 +4,7 @@ from typing import Optional
 from pydantic import BaseModel
 
 from app.models.behavior_test_run import TestRunStatus
+from app.schemas.base import OrmFastMixin
 
 
 class BehaviorTestRunBase(BaseModel):
@@ -19,7 +20,7 @@ class BehaviorTestRunCreate(BehaviorTestRunBase):
     pass
 
 
-class BehaviorTestRunRead(BehaviorTestRunBase):
+class BehaviorTestRunRead(OrmFastMixin, BehaviorTestRunBase):
     id: int
     created_at: datetime
 
@@ -5,6 +5,8 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from app.schemas.base import OrmFastMixin
+
 
 class BehaviorImplementationBase(BaseModel):
     behavior_id: int
@@ -29,7 +31,7 @@ class BehaviorImplementationUpdate(BaseModel):
     notes: Optional[str] = None
 
 
-class BehaviorImplementationRead(BehaviorImplementationBase):
+class BehaviorImplementationRead(OrmFastMixin, BehaviorImplementationBase):
     id: int
     created_at: datetime
     updated_at: datetime
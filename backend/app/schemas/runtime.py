@@ -4,10 +4,15 @@ from __future__ import annotations
 from typing import Optional
 
 from pydantic import BaseModel
+from typing_extensions import TypedDict
 
 from app.schemas.implementation import BehaviorImplementationRead
 
 
+# Responses that are only ever built server-side from plain values are
+# TypedDicts: handlers return dicts and skip constructing a model first.
+
+
 # ---------- Test a single implementation in Podman ----------
 
 
@@ -15,13 +20,16 @@ class TestImplementationRequest(BaseModel):
     implementation_id: int
 
 
-class TestImplementationResponse(BaseModel):
+class TestImplementationResponse(TypedDict):
     implementation_id: int
     exit_code: int
+    # For runs with a run_id these are the last 8 KB; the full logs are at
+    # GET /runtime/test-implementation/{run_id}/stdout (and /stderr).
     stdout: str
     stderr: str
     container_image: str
     elapsed_seconds: float
+    run_id: Optional[str]
 
 
 # ---------- Build legacy harness repo (separate tests repo) ----------
@@ -51,14 +59,16 @@ class RunLegacyWithHarnessRequest(BaseModel):
     contract_id: Optional[int] = None
 
 
-class RunLegacyWithHarnessResponse(BaseModel):
+class RunLegacyWithHarnessResponse(TypedDict):
     legacy_implementation_id: int
     harness_implementation_id: int
     exit_code: int
+    # Tails only, as for TestImplementationResponse; full logs by run_id.
     stdout: str
     stderr: str
     container_image: str
     elapsed_seconds: float
+    run_id: Optional[str]
 
 
 # ---------- Build converted tests inside converted repo ----------
@@ -80,7 +90,7 @@ class DeployServiceRequest(BaseModel):
     implementation_id: int
 
 
-class DeployServiceResponse(BaseModel):
+class DeployServiceResponse(TypedDict):
     implementation_id: int
 
     # Image + container details
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 
 from openai import AsyncOpenAI
 from google import genai
@@ -9,6 +12,44 @@ from google import genai
 from app.core.config import settings
 
 
+# The google-genai client is sync; its calls run on this dedicated pool
+# (instead of asyncio's default executor), whose size caps concurrent
+# Gemini requests.
+_GOOGLE_POOL = ThreadPoolExecutor(
+    max_workers=max(settings.AI_MAX_CONCURRENCY, 1),
+    thread_name_prefix="genai",
+)
+atexit.register(_GOOGLE_POOL.shutdown, wait=False)
+
+
+# Gemini prompts: everything before the code depends only on the language,
+# so it is formatted once per (template, language) and the code appended.
+_SUMMARIZE_GOOGLE_TMPL = (
+    "You are analyzing legacy {language} source code.\n\n"
+    "Provide a concise, high-level summary (3–6 sentences) of what this file does, "
+    "including its main responsibilities and any important side effects.\n\n"
+    "Return plain text without markdown headings.\n\n"
+    "--- CODE START ---\n"
+)
+_CONTRACT_GOOGLE_TMPL = (
+    "You are designing a language-agnostic behavior contract for {language} source code.\n\n"
+    "Based on the code below, describe its behavior in terms of:\n"
+    "- Inputs (parameters, expected types, constraints)\n"
+    "- Outputs (return values, side effects, files produced)\n"
+    "- Error conditions\n"
+    "- 1–3 example test cases\n\n"
+    "Return the contract as structured Markdown, and do NOT invent behavior "
+    "that is not clearly implied by the code.\n\n"
+    "--- CODE START ---\n"
+)
+_CODE_TAIL = "\n--- CODE END ---"
+
+
+@lru_cache(maxsize=32)
+def _google_prompt_head(template: str, language: str) -> str:
+    return template.format(language=language)
+
+
 class AIProvider(str, Enum):
     GOOGLE = "google"
     OPENAI = "openai"
@@ -72,17 +113,16 @@ class AIClient:
     # ------------------------------------------------------------------
     async def summarize_code(self, code_text: str, language: str) -> str:
         if self.provider is AIProvider.GOOGLE:
-            # google-genai client is sync; wrap in to_thread
-            return await asyncio.to_thread(
-                self._summarize_code_google, code_text, language
+            return await asyncio.get_running_loop().run_in_executor(
+                _GOOGLE_POOL, self._summarize_code_google, code_text, language
             )
         else:
             return await self._summarize_code_openai(code_text, language)
 
     async def suggest_contract(self, code_text: str, language: str) -> str:
         if self.provider is AIProvider.GOOGLE:
-            return await asyncio.to_thread(
-                self._suggest_contract_google, code_text, language
+            return await asyncio.get_running_loop().run_in_executor(
+                _GOOGLE_POOL, self._suggest_contract_google, code_text, language
             )
         else:
             return await self._suggest_contract_openai(code_text, language)
@@ -94,12 +134,8 @@ class AIClient:
         if not self._google_client or not self._google_model_name:
             raise AIClientError("Google client/model not initialized")
 
-        prompt = (
-            f"You are analyzing legacy {language} source code.\n\n"
-            f"Provide a concise, high-level summary (3–6 sentences) of what this file does, "
-            f"including its main responsibilities and any important side effects.\n\n"
-            f"Return plain text without markdown headings.\n\n"
-            f"--- CODE START ---\n{code_text}\n--- CODE END ---"
+        prompt = "".join(
+            (_google_prompt_head(_SUMMARIZE_GOOGLE_TMPL, language), code_text, _CODE_TAIL)
         )
 
         resp = self._google_client.models.generate_content(
@@ -113,16 +149,8 @@ class AIClient:
         if not self._google_client or not self._google_model_name:
             raise AIClientError("Google client/model not initialized")
 
-        prompt = (
-            f"You are designing a language-agnostic behavior contract for {language} source code.\n\n"
-            f"Based on the code below, describe its behavior in terms of:\n"
-            f"- Inputs (parameters, expected types, constraints)\n"
-            f"- Outputs (return values, side effects, files produced)\n"
-            f"- Error conditions\n"
-            f"- 1–3 example test cases\n\n"
-            f"Return the contract as structured Markdown, and do NOT invent behavior "
-            f"that is not clearly implied by the code.\n\n"
-            f"--- CODE START ---\n{code_text}\n--- CODE END ---"
+        prompt = "".join(
+            (_google_prompt_head(_CONTRACT_GOOGLE_TMPL, language), code_text, _CODE_TAIL)
         )
 
         resp = self._google_client.models.generate_content(
@@ -195,11 +223,7 @@ class AIClient:
         return (resp.choices[0].message.content or "").strip()
 
 
-_ai_client: AIClient | None = None
-
-
+@lru_cache(maxsize=1)
 def get_ai_client() -> AIClient:
-    global _ai_client
-    if _ai_client is None:
-        _ai_client = AIClient()
-    return _ai_client
+    """Process-wide AIClient, built on first use (a failed build isn't cached)."""
+    return AIClient()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import datetime
 from pathlib import PurePosixPath
 from typing import Dict, Any, List, Optional
 
@@ -412,19 +411,31 @@ async def convert_behavior_stub(
         for r in python_requirements:
             add_req(r)
 
-        requirements_lines = [
-            "# Auto-generated by MultiLang Behavior Engine",
-            "# You can edit this file as needed.",
-            "",
-            *all_reqs,
-        ]
-        requirements_content = "\n".join(requirements_lines) + "\n"
+        def merge_requirements(current: Optional[str]) -> str:
+            # The target repo is shared by every behavior converted into it,
+            # so keep what earlier behaviors added. Sorted after pytest, so
+            # the result doesn't depend on which behavior finished last.
+            existing = [
+                line.strip()
+                for line in (current or "").splitlines()
+                if line.strip() and not line.lstrip().startswith("#")
+            ]
+            merged = set(existing) | set(all_reqs)
+            merged.discard("pytest")
+            requirements_lines = [
+                "# Auto-generated by MultiLang Behavior Engine",
+                "# You can edit this file as needed.",
+                "",
+                "pytest",
+                *sorted(merged),
+            ]
+            return "\n".join(requirements_lines) + "\n"
 
         try:
-            await gh.create_or_update_file(
+            await gh.update_file(
                 repo=repo,
                 path="requirements.txt",
-                content=requirements_content,
+                update=merge_requirements,
                 commit_message=(
                     f"Add/Update auto-generated requirements.txt for behavior {behavior.id}"
                 ),
@@ -441,7 +452,6 @@ async def convert_behavior_stub(
             notes_requirements = f"WARNING: failed to write requirements.txt: {exc}"
 
     # ---- DB record for target implementation ----
-    now = datetime.utcnow()
     notes_lines = [
         "# Conversion result",
         "",
@@ -476,8 +486,6 @@ async def convert_behavior_stub(
         file_path=target_path,
         status="candidate",
         notes=notes_md,
-        created_at=now,
-        updated_at=now,
     )
 
     db.add(target_impl)
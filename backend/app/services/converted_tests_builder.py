@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import tempfile
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
@@ -158,8 +157,6 @@ async def build_converted_tests_for_implementation(
                 ) from exc
 
     # --- Update BehaviorImplementation metadata ---
-    now = datetime.utcnow()
-
     notes_lines = []
     if impl.notes:
         notes_lines.append(impl.notes.rstrip())
@@ -187,7 +184,6 @@ async def build_converted_tests_for_implementation(
     )
 
     impl.notes = "\n".join(notes_lines)
-    impl.updated_at = now
 
     db.add(impl)
     db.commit()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
 import httpx
 
@@ -45,6 +46,11 @@ class GitHubClient:
             "Accept": "application/vnd.github+json",
         }
 
+        # Contents API writes are GET-sha-then-PUT and each PUT commits to the
+        # branch, so concurrent writes to one repo conflict (409) or lose
+        # updates. They are serialized per repo.
+        self._write_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
     async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
         url = f"{self.api_base_url}{path}"
         async with httpx.AsyncClient(timeout=30.0) as client:
@@ -104,31 +110,49 @@ class GitHubClient:
         Create or update a single file using the GitHub Contents API,
         returning the file's HTML URL.
         """
-        api_path = f"/repos/{repo.owner}/{repo.name}/contents/{path.lstrip('/')}"
-        encoded = base64.b64encode(content.encode("utf-8")).decode("ascii")
+        return await self.update_file(repo, path, lambda _current: content, commit_message)
 
-        # We first try to GET the file to see if it exists (and get the sha)
-        sha: Optional[str] = None
-        try:
-            resp = await self._request("GET", api_path)
-            data = resp.json()
-            sha = data.get("sha")
-        except GitHubError:
-            sha = None
+    async def update_file(
+        self,
+        repo: GitHubRepoInfo,
+        path: str,
+        update: Callable[[Optional[str]], str],
+        commit_message: str,
+    ) -> str:
+        """
+        Read-modify-write of a single file: `update` gets the current text
+        (None if the file doesn't exist) and returns the new text. Runs under
+        the per-repo write lock, so concurrent updates of a shared file (e.g.
+        requirements.txt) see each other's changes.
+        """
+        api_path = f"/repos/{repo.owner}/{repo.name}/contents/{path.lstrip('/')}"
 
-        body = {
-            "message": commit_message,
-            "content": encoded,
-            "branch": repo.default_branch,
-        }
-        if sha:
-            body["sha"] = sha
+        async with self._write_locks.setdefault((repo.owner, repo.name), asyncio.Lock()):
+            # We first try to GET the file to see if it exists (and get the sha)
+            sha: Optional[str] = None
+            current: Optional[str] = None
+            try:
+                resp = await self._request("GET", api_path)
+                data = resp.json()
+                sha = data.get("sha")
+                if data.get("content"):
+                    current = base64.b64decode(data["content"]).decode("utf-8")
+            except GitHubError:
+                sha = None
+
+            encoded = base64.b64encode(update(current).encode("utf-8")).decode("ascii")
+            body = {
+                "message": commit_message,
+                "content": encoded,
+                "branch": repo.default_branch,
+            }
+            if sha:
+                body["sha"] = sha
 
-        resp = await self._request("PUT", api_path, json=body)
+            resp = await self._request("PUT", api_path, json=body)
         data = resp.json()
         return data["content"]["html_url"]
 
-
 _github_client: Optional[GitHubClient] = None
 
 
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import cache_delete, cache_get, cache_set
+from app.models.behavior_implementation import BehaviorImplementation
+from app.schemas.behavior_implementation import BehaviorImplementationRead
+
+# Safety net only: entries are invalidated on commit (see below).
+CACHE_TTL_SECONDS = 300
+
+_IMPL_LIST_ADAPTER = TypeAdapter(List[BehaviorImplementationRead])
+
+_PENDING_KEY = "implementation_cache_keys"
+
+
+def _impl_key(implementation_id: int) -> str:
+    return f"impl:{implementation_id}"
+
+
+def _behavior_key(behavior_id: int) -> str:
+    return f"impl:behavior:{behavior_id}"
+
+
+def get_cached_implementation(implementation_id: int) -> Optional[BehaviorImplementationRead]:
+    raw = cache_get(_impl_key(implementation_id))
+    if raw is None:
+        return None
+    return BehaviorImplementationRead.model_validate_json(raw)
+
+
+def cache_implementation(obj: BehaviorImplementation) -> BehaviorImplementationRead:
+    model = BehaviorImplementationRead.from_orm_fast(obj)
+    cache_set(_impl_key(model.id), model.model_dump_json(), CACHE_TTL_SECONDS)
+    return model
+
+
+def get_cached_implementations_for_behavior(
+    behavior_id: int,
+) -> Optional[List[BehaviorImplementationRead]]:
+    raw = cache_get(_behavior_key(behavior_id))
+    if raw is None:
+        return None
+    return _IMPL_LIST_ADAPTER.validate_json(raw)
+
+
+def cache_implementations_for_behavior(
+    behavior_id: int,
+    impls: List[BehaviorImplementation],
+) -> List[BehaviorImplementationRead]:
+    models = [BehaviorImplementationRead.from_orm_fast(impl) for impl in impls]
+    cache_set(_behavior_key(behavior_id), _IMPL_LIST_ADAPTER.dump_json(models), CACHE_TTL_SECONDS)
+    return models
+
+
+# ---------- Invalidation ----------
+#
+# Implementations are written from several places (this router, conversion,
+# harness and test builders), so invalidation hooks the ORM rather than the
+# individual handlers: keys touched during a flush are collected on the
+# session and deleted once the transaction commits.
+
+
+def _mark_dirty(mapper, connection, target: BehaviorImplementation) -> None:
+    session = object_session(target)
+    if session is None:
+        return
+    keys = session.info.setdefault(_PENDING_KEY, set())
+    keys.add(_impl_key(target.id))
+    keys.add(_behavior_key(target.behavior_id))
+    # An update that moves the row to another behavior must also drop the
+    # old behavior's list; mapper events run inside the flush, so the
+    # attribute history still holds the previous value.
+    for old_behavior_id in inspect(target).attrs.behavior_id.history.deleted:
+        if old_behavior_id is not None:
+            keys.add(_behavior_key(old_behavior_id))
+
+
+for _evt in ("after_insert", "after_update", "after_delete"):
+    event.listen(BehaviorImplementation, _evt, _mark_dirty)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    keys = session.info.pop(_PENDING_KEY, None)
+    if keys:
+        cache_delete(*keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -2,11 +2,20 @@ from __future__ import annotations
 
 import os
 import asyncio
+import contextlib
+import hashlib
+import re
+import shlex
+import shutil
 import time
+import uuid
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 
+import httpx
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -22,11 +31,19 @@ class PodmanRuntimeError(RuntimeError):
     can surface useful debugging info.
     """
 
-    def __init__(self, message: str, stdout: str = "", stderr: str = "", exit_code: int | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        stdout: str = "",
+        stderr: str = "",
+        exit_code: int | None = None,
+        run_id: str | None = None,
+    ) -> None:
         super().__init__(message)
         self.stdout = stdout
         self.stderr = stderr
         self.exit_code = exit_code
+        self.run_id = run_id
 
     def __str__(self) -> str:
         base = super().__str__()
@@ -60,6 +77,9 @@ class PodmanResult:
     stderr: str
     container_image: str
     elapsed_seconds: float
+    # Set when the full output was streamed to disk; stdout/stderr then hold
+    # only the last OUTPUT_TAIL_BYTES (see test_run_log_path).
+    run_id: Optional[str] = None
 
 
 # ---------- Container runtime configuration ----------
@@ -72,9 +92,53 @@ GIT_BIN = os.getenv("MLBE_GIT_BIN", "git")
 # ---------- Low-level podman wrapper ----------
 
 
-async def run_podman(args: List[str], cwd: Optional[Path] = None) -> PodmanExecResult:
+def _container_command(*cmds: list[str] | str | None) -> list[str]:
+    """
+    Turn adapter build/test commands into the container's argv.
+
+    A single argv-list command is exec'd directly; anything else is chained
+    with && through `/bin/sh -lc`.
+    """
+    steps = [cmd for cmd in cmds if cmd]
+    if len(steps) == 1 and isinstance(steps[0], list):
+        return list(steps[0])
+    return ["/bin/sh", "-lc", _shell_command(*steps)]
+
+
+def _shell_command(*cmds: list[str] | str | None) -> str:
+    """Chain adapter commands with && as a single shell string."""
+    return " && ".join(
+        cmd if isinstance(cmd, str) else shlex.join(cmd) for cmd in cmds if cmd
+    )
+
+
+# How much of a streamed run's output is kept in memory / returned inline.
+OUTPUT_TAIL_BYTES = 8192
+_READ_CHUNK = 65536
+
+
+async def _drain_to_file(stream: asyncio.StreamReader, path: Path) -> str:
+    """Copy a process pipe to `path` chunk by chunk; return the decoded tail."""
+    tail = bytearray()
+    with open(path, "wb") as fh:
+        while chunk := await stream.read(_READ_CHUNK):
+            fh.write(chunk)
+            tail += chunk
+            if len(tail) > OUTPUT_TAIL_BYTES:
+                del tail[:-OUTPUT_TAIL_BYTES]
+    return tail.decode(errors="replace")
+
+
+async def run_podman(
+    args: List[str],
+    cwd: Optional[Path] = None,
+    output_dir: Optional[Path] = None,
+) -> PodmanExecResult:
     """
     Run the configured container runtime (PODMAN_BIN) with the given args.
+
+    With `output_dir`, stdout/stderr are streamed to stdout.log/stderr.log
+    there instead of being buffered, and only their tails are returned.
     """
     if DEBUG_PODMAN:
         print(f"[MLBE_DEBUG] run_podman: PODMAN_BIN={PODMAN_BIN!r}, args={args}, cwd={cwd}")
@@ -98,9 +162,17 @@ async def run_podman(args: List[str], cwd: Optional[Path] = None) -> PodmanExecR
             )
         ) from exc
 
-    stdout_b, stderr_b = await proc.communicate()
-    stdout = stdout_b.decode()
-    stderr = stderr_b.decode()
+    if output_dir is None:
+        stdout_b, stderr_b = await proc.communicate()
+        stdout = stdout_b.decode(errors="replace")
+        stderr = stderr_b.decode(errors="replace")
+    else:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stdout, stderr = await asyncio.gather(
+            _drain_to_file(proc.stdout, output_dir / "stdout.log"),
+            _drain_to_file(proc.stderr, output_dir / "stderr.log"),
+        )
+        await proc.wait()
 
     if proc.returncode != 0:
         raise PodmanRuntimeError(
@@ -112,6 +184,349 @@ async def run_podman(args: List[str], cwd: Optional[Path] = None) -> PodmanExecR
 
     return PodmanExecResult(stdout=stdout, stderr=stderr, exit_code=proc.returncode)
 
+
+async def start_containers(names: List[str]) -> None:
+    """
+    Best-effort `start` of long-lived helper containers (e.g. registry caches).
+
+    Starting an already-running container is a no-op; a missing container or
+    runtime is ignored, since these only speed things up.
+    """
+    for name in names:
+        try:
+            await run_podman(["start", name])
+        except PodmanRuntimeError:
+            pass
+
+
+# Images known to be present locally. Images don't disappear under a running
+# backend in practice, and if one does, `podman run` still pulls it itself.
+_present_images: set[str] = set()
+_image_locks: dict[str, asyncio.Lock] = {}
+
+
+async def ensure_image(image: str) -> None:
+    """
+    Make sure `image` is available locally, pulling it only if it's missing.
+
+    The first call per image forks `image exists` (cheaper than inspect);
+    after that it's a set lookup. Keeping the pull out of `run` also keeps
+    pull time out of the reported test elapsed_seconds.
+    """
+    if image in _present_images:
+        return
+    lock = _image_locks.setdefault(image, asyncio.Lock())
+    async with lock:
+        if image in _present_images:
+            return
+        try:
+            await run_podman(["image", "exists", image])
+        except PodmanRuntimeError:
+            await run_podman(["pull", image])
+        _present_images.add(image)
+
+# ---------- Warm sandbox containers ----------
+
+
+class SandboxPool:
+    """
+    Long-running containers (`sleep infinity`) per image that test runs
+    `exec` into, skipping the create/start/rm cycle of a fresh `podman run`.
+
+    Each run copies its checkouts into an idle sandbox (e.g. the repo to
+    /code, or legacy repo to /code and harness to /tests), execs the command
+    and removes those directories afterwards. Containers are started lazily
+    (up to `size` per image); callers queue for one when all are busy.
+    Anything the build installs outside /code (e.g. pip packages) persists
+    in the sandbox across runs.
+
+    A sandbox is dropped, and later replaced, when podman itself fails on it
+    (exit 125) or cleanup fails. Waiters are woken whenever a sandbox comes
+    back or a slot frees up, so a dropped sandbox is respawned by the next
+    caller in line rather than leaving it waiting.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._idle: dict[str, list[str]] = {}
+        self._spawned: dict[str, int] = {}
+        self._conds: dict[str, asyncio.Condition] = {}
+        self._names: set[str] = set()
+
+    async def run(
+        self,
+        image: str,
+        dirs: dict[str, Path],
+        workdir: str,
+        argv: List[str],
+        output_dir: Optional[Path] = None,
+    ) -> PodmanExecResult:
+        """
+        Run `argv` in `workdir` of an idle sandbox, after copying each host
+        directory in `dirs` ({container_path: host_path}) into it.
+        """
+        name = await self._acquire(image)
+        healthy = True
+        try:
+            for target, host_root in dirs.items():
+                await run_podman(["cp", f"{host_root}/.", f"{name}:{target}"])
+            return await run_podman(
+                ["exec", "-w", workdir, name, *argv], output_dir=output_dir
+            )
+        except PodmanRuntimeError as exc:
+            if exc.exit_code in (None, 125):
+                healthy = False
+            raise
+        finally:
+            if healthy:
+                try:
+                    await run_podman(["exec", name, "rm", "-rf", *dirs])
+                except PodmanRuntimeError:
+                    healthy = False
+            if healthy:
+                await self._release(image, name)
+            else:
+                await self._discard(image, name)
+
+    async def close(self) -> None:
+        names, self._names = list(self._names), set()
+        self._idle.clear()
+        self._spawned.clear()
+        for name in names:
+            await _remove_container(name)
+
+    def _cond(self, image: str) -> asyncio.Condition:
+        return self._conds.setdefault(image, asyncio.Condition())
+
+    async def _acquire(self, image: str) -> str:
+        cond = self._cond(image)
+        idle = self._idle.setdefault(image, [])
+        async with cond:
+            await cond.wait_for(
+                lambda: idle or self._spawned.get(image, 0) < self.size
+            )
+            if idle:
+                return idle.pop()
+            # Claim the slot while holding the condition, so concurrent
+            # callers can't overshoot the pool size.
+            self._spawned[image] = self._spawned.get(image, 0) + 1
+        try:
+            return await self._spawn(image)
+        except BaseException:
+            await self._free_slot(image)
+            raise
+
+    async def _release(self, image: str, name: str) -> None:
+        cond = self._cond(image)
+        async with cond:
+            self._idle.setdefault(image, []).append(name)
+            cond.notify()
+
+    async def _free_slot(self, image: str) -> None:
+        cond = self._cond(image)
+        async with cond:
+            self._spawned[image] = max(self._spawned.get(image, 1) - 1, 0)
+            cond.notify()
+
+    async def _spawn(self, image: str) -> str:
+        await ensure_image(image)
+        name = f"mlbe-sandbox-{uuid.uuid4().hex[:12]}"
+        await run_podman(
+            ["run", "-d", "--name", name, "--entrypoint", "sleep", image, "infinity"]
+        )
+        self._names.add(name)
+        return name
+
+    async def _discard(self, image: str, name: str) -> None:
+        self._names.discard(name)
+        await self._free_slot(image)
+        await _remove_container(name)
+
+
+async def _remove_container(name: str) -> None:
+    try:
+        await run_podman(["rm", "-f", name])
+    except PodmanRuntimeError:
+        pass
+
+
+_sandbox_pool: Optional[SandboxPool] = (
+    SandboxPool(settings.SANDBOX_POOL_SIZE) if settings.SANDBOX_POOL_SIZE > 0 else None
+)
+
+
+async def close_sandboxes() -> None:
+    """Remove the warm sandbox containers (called on app shutdown)."""
+    if _sandbox_pool is not None:
+        await _sandbox_pool.close()
+
+
+# ---------- Podman REST API (optional) ----------
+
+
+class PodmanApiUnavailable(Exception):
+    """The API socket couldn't be reached; callers fall back to the CLI."""
+
+
+class PodmanApiClient:
+    """
+    One-off containers (`run --rm -v ... -w ... image argv`) through the
+    Podman REST API, over a single keep-alive connection to its unix socket
+    instead of forking the CLI per run.
+
+    Errors mirror run_podman(): a non-zero container exit raises
+    PodmanRuntimeError with the output and exit code.
+    """
+
+    def __init__(self, socket_path: str) -> None:
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=socket_path),
+            base_url="http://podman/v4.0.0/libpod",
+            # /wait and /logs last as long as the tests do.
+            timeout=httpx.Timeout(30.0, read=None),
+        )
+
+    async def run(
+        self,
+        image: str,
+        dirs: dict[str, Path],
+        workdir: str,
+        argv: List[str],
+        output_dir: Optional[Path] = None,
+    ) -> PodmanExecResult:
+        spec = {
+            "image": image,
+            "command": argv,
+            "work_dir": workdir,
+            "mounts": [
+                {"type": "bind", "source": str(host), "destination": target}
+                for target, host in dirs.items()
+            ],
+        }
+        try:
+            created = await self._request("POST", "/containers/create", json=spec)
+        except httpx.TransportError as exc:
+            raise PodmanApiUnavailable(str(exc)) from exc
+
+        cid = created.json()["Id"]
+        try:
+            await self._request("POST", f"/containers/{cid}/start")
+            exit_code = int((await self._request("POST", f"/containers/{cid}/wait")).json())
+            stdout, stderr = await self._logs(cid, output_dir)
+        except httpx.HTTPError as exc:
+            raise PodmanRuntimeError(f"Podman API call failed: {exc}") from exc
+        finally:
+            try:
+                await self._client.delete(f"/containers/{cid}", params={"force": "true"})
+            except httpx.HTTPError:
+                pass
+
+        if exit_code != 0:
+            raise PodmanRuntimeError(
+                f"container {image} {shlex.join(argv)} failed with exit {exit_code}",
+                stdout=stdout,
+                stderr=stderr,
+                exit_code=exit_code,
+            )
+        return PodmanExecResult(stdout=stdout, stderr=stderr, exit_code=exit_code)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        resp = await self._client.request(method, path, **kwargs)
+        if resp.is_error:
+            raise PodmanRuntimeError(
+                f"Podman API {method} {path} failed with HTTP {resp.status_code}",
+                stderr=resp.text,
+            )
+        return resp
+
+    async def _logs(self, cid: str, output_dir: Optional[Path]) -> tuple[str, str]:
+        """
+        Demultiplex the container's log stream (8-byte frame headers: stream
+        id, padding, big-endian payload size) into stdout/stderr. With
+        `output_dir`, written to stdout.log/stderr.log like run_podman() and
+        only the tails are returned.
+        """
+        out, err = bytearray(), bytearray()
+        files = None
+        if output_dir is not None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            files = (
+                open(output_dir / "stdout.log", "wb"),
+                open(output_dir / "stderr.log", "wb"),
+            )
+        try:
+            async with self._client.stream(
+                "GET", f"/containers/{cid}/logs", params={"stdout": "true", "stderr": "true"}
+            ) as resp:
+                if resp.is_error:
+                    raise PodmanRuntimeError(
+                        f"Podman API GET /containers/{cid}/logs failed with HTTP {resp.status_code}"
+                    )
+                buf = bytearray()
+                async for chunk in resp.aiter_bytes(_READ_CHUNK):
+                    buf += chunk
+                    pos = 0
+                    while len(buf) - pos >= 8:
+                        size = int.from_bytes(buf[pos + 4:pos + 8], "big")
+                        end = pos + 8 + size
+                        if end > len(buf):
+                            break
+                        is_err = buf[pos] == 2
+                        payload = buf[pos + 8:end]
+                        pos = end
+                        target = err if is_err else out
+                        target += payload
+                        if files is not None:
+                            files[is_err].write(payload)
+                            if len(target) > OUTPUT_TAIL_BYTES:
+                                del target[:-OUTPUT_TAIL_BYTES]
+                    del buf[:pos]
+        finally:
+            if files is not None:
+                for fh in files:
+                    fh.close()
+        return out.decode(errors="replace"), err.decode(errors="replace")
+
+
+_podman_api: Optional[PodmanApiClient] = (
+    PodmanApiClient(settings.PODMAN_SOCKET) if settings.PODMAN_SOCKET else None
+)
+
+
+async def close_podman_api() -> None:
+    """Close the Podman API connection (called on app shutdown)."""
+    if _podman_api is not None:
+        await _podman_api.close()
+
+
+async def _run_container(
+    image: str,
+    dirs: dict[str, Path],
+    workdir: str,
+    argv: List[str],
+    output_dir: Optional[Path] = None,
+) -> PodmanExecResult:
+    """
+    `podman run --rm` with `dirs` ({container_path: host_path}) bind-mounted,
+    via the REST API when PODMAN_SOCKET is set and reachable, else the CLI.
+    """
+    if _podman_api is not None:
+        try:
+            return await _podman_api.run(image, dirs, workdir, argv, output_dir)
+        except PodmanApiUnavailable:
+            pass
+
+    mounts: list[str] = []
+    for target, host in dirs.items():
+        mounts.extend(("-v", f"{host}:{target}"))
+    return await run_podman(
+        ["run", "--rm", *mounts, "-w", workdir, image, *argv], output_dir=output_dir
+    )
+
+
 # ---------- Local git helpers (self-contained) ----------
 
 
@@ -172,8 +587,8 @@ async def _run_git(args: list[str], cwd: Path) -> None:
         ) from exc
 
     stdout_b, stderr_b = await proc.communicate()
-    stdout = stdout_b.decode()
-    stderr = stderr_b.decode()
+    stdout = stdout_b.decode(errors="replace")
+    stderr = stderr_b.decode(errors="replace")
 
     if proc.returncode != 0:
         raise PodmanRuntimeError(
@@ -209,6 +624,21 @@ def _with_github_token(repo_url: str) -> str:
     return repo_url
 
 
+# One lock per checkout dir, held by checked_out_repos() for git and for any
+# container run against the tree.
+_repo_locks: dict[str, asyncio.Lock] = {}
+
+_UNSAFE_PATH_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def _checkout_dir_name(repo_name: str, revision: str) -> str:
+    safe = _UNSAFE_PATH_CHARS_RE.sub("_", revision)
+    if safe != revision:
+        # Keep e.g. "feature/x" and "feature_x" apart.
+        safe += "-" + hashlib.sha1(revision.encode()).hexdigest()[:8]
+    return f"{repo_name}@{safe}"
+
+
 async def clone_or_update_repo(
     repo_url: str,
     base_dir: Path,
@@ -219,14 +649,51 @@ async def clone_or_update_repo(
 
     - Accepts either HTML or .git-style URLs.
     - Injects GitHub token into URL if present (for private repos).
-    - If repo directory exists:
+    - Each revision gets its own checkout dir (<repo>@<revision>), so runs at
+      different revisions of one repo never share a working tree.
+    - If that directory exists:
         git fetch; git checkout <revision>; git pull --ff-only origin <revision>
     - Else:
         git clone <repo_url> <dir>; git checkout <revision>
+
+    The checkout is only locked while git runs; use checked_out_repos() to
+    keep it locked while a container uses the tree.
+    """
+    async with checked_out_repos([(repo_url, revision)], base_dir) as (repo_path,):
+        return repo_path
+
+
+@asynccontextmanager
+async def checked_out_repos(
+    specs: List[tuple[str, str]],
+    base_dir: Path,
+) -> AsyncIterator[List[Path]]:
+    """
+    Clone/update each (repo_url, revision) like clone_or_update_repo() and
+    keep the checkouts locked until the block exits, so no concurrent run can
+    check out, pull or build in a tree while a container is using it.
+
+    Yields the checkout paths in `specs` order. Specs that map to the same
+    checkout share it (and its lock); locks are taken in path order so
+    overlapping callers can't deadlock.
     """
     base_dir = base_dir.resolve()
     base_dir.mkdir(parents=True, exist_ok=True)
 
+    targets = [_checkout_target(repo_url, base_dir, revision) for repo_url, revision in specs]
+    unique = {repo_path: (clone_url, revision) for clone_url, repo_path, revision in targets}
+    async with contextlib.AsyncExitStack() as stack:
+        for repo_path in sorted(unique):
+            await stack.enter_async_context(
+                _repo_locks.setdefault(str(repo_path), asyncio.Lock())
+            )
+            clone_url, revision = unique[repo_path]
+            await _update_checkout(clone_url, repo_path, revision, base_dir)
+        yield [repo_path for _url, repo_path, _rev in targets]
+
+
+def _checkout_target(repo_url: str, base_dir: Path, revision: str) -> tuple[str, Path, str]:
+    """(clone URL, checkout dir, revision) for a repo at a revision."""
     # Normalize to .git URL
     raw_url = repo_url.rstrip("/")
     if not raw_url.endswith(".git"):
@@ -240,53 +707,112 @@ async def clone_or_update_repo(
     if repo_name.endswith(".git"):
         repo_name = repo_name[:-4]
 
-    repo_path = base_dir / repo_name
+    return clone_url, base_dir / _checkout_dir_name(repo_name, revision), revision
+
 
+async def _update_checkout(clone_url: str, repo_path: Path, revision: str, base_dir: Path) -> None:
+    """Clone or fast-forward `repo_path` to `revision`; caller holds its lock."""
     if repo_path.exists():
         # Update existing clone
         await _run_git(["fetch", "origin"], cwd=repo_path)
         await _run_git(["checkout", revision], cwd=repo_path)
         await _run_git(["pull", "--ff-only", "origin", revision], cwd=repo_path)
-    else:
-        # New clone
-        proc = await asyncio.create_subprocess_exec(
-            "git",
-            "clone",
-            clone_url,
-            str(repo_path),
-            cwd=str(base_dir),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        return
+
+    # New clone
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        "clone",
+        clone_url,
+        str(repo_path),
+        cwd=str(base_dir),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout_b, stderr_b = await proc.communicate()
+    stdout = stdout_b.decode(errors="replace")
+    stderr = stderr_b.decode(errors="replace")
+    if proc.returncode != 0:
+        raise PodmanRuntimeError(
+            f"git clone failed with exit {proc.returncode}",
+            stdout=stdout,
+            stderr=stderr,
+            exit_code=proc.returncode,
         )
-        stdout_b, stderr_b = await proc.communicate()
-        stdout = stdout_b.decode()
-        stderr = stderr_b.decode()
-        if proc.returncode != 0:
-            raise PodmanRuntimeError(
-                f"git clone failed with exit {proc.returncode}",
-                stdout=stdout,
-                stderr=stderr,
-                exit_code=proc.returncode,
-            )
 
-        # Checkout requested revision (branch/tag/commit)
-        await _run_git(["checkout", revision], cwd=repo_path)
-
-    return repo_path
+    # Checkout requested revision (branch/tag/commit)
+    await _run_git(["checkout", revision], cwd=repo_path)
 
 
 # ---------- High-level helpers used by FastAPI routes ----------
 
 
-async def run_tests_for_implementation(
-    db: Session,
-    implementation_id: int,
-) -> PodmanResult:
-    """
-    Run tests for a single BehaviorImplementation in an ephemeral container.
+def _test_runs_root() -> Path:
+    return _runtime_workspace_root() / "test_runs"
 
-    Uses the LanguageAdapter's docker_image + build_command + test_command.
+
+_RUN_ID_RE = re.compile(r"[0-9a-f]{32}")
+
+# Pruning scans the whole test_runs dir, so it runs at most this often.
+_PRUNE_INTERVAL_SECONDS = 600
+_last_prune: float | None = None
+
+
+def prune_test_runs() -> None:
     """
+    Delete run log dirs older than TEST_RUN_LOG_RETENTION_HOURS (by mtime).
+    Blocking; see _maybe_prune_test_runs() for the run path.
+    """
+    hours = settings.TEST_RUN_LOG_RETENTION_HOURS
+    if hours <= 0:
+        return
+    cutoff = time.time() - hours * 3600
+    try:
+        entries = list(os.scandir(_test_runs_root()))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if not _RUN_ID_RE.fullmatch(entry.name):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        except FileNotFoundError:
+            pass
+
+
+async def _maybe_prune_test_runs() -> None:
+    """prune_test_runs() off the event loop, at most every _PRUNE_INTERVAL_SECONDS."""
+    global _last_prune
+    now = time.monotonic()
+    if _last_prune is not None and now - _last_prune < _PRUNE_INTERVAL_SECONDS:
+        return
+    _last_prune = now
+    await asyncio.to_thread(prune_test_runs)
+
+
+def test_run_log_path(run_id: str, stream: str) -> Optional[Path]:
+    """
+    Path of a test run's full stdout/stderr log, or None if it doesn't exist
+    (or run_id / stream aren't valid).
+    """
+    if stream not in ("stdout", "stderr") or not _RUN_ID_RE.fullmatch(run_id):
+        return None
+    path = _test_runs_root() / run_id / f"{stream}.log"
+    return path if path.is_file() else None
+
+
+@lru_cache(maxsize=1)
+def _runtime_workspace_root() -> Path:
+    # Settings are fixed for the process; resolve the path (and create it)
+    # once rather than per request. checked_out_repos() still mkdirs, so
+    # a workspace removed at runtime is recreated.
+    root = Path(os.path.abspath(settings.ANALYZER_WORKSPACE_ROOT))
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def _get_testable_implementation(db: Session, implementation_id: int) -> BehaviorImplementation:
     impl: Optional[BehaviorImplementation] = (
         db.query(BehaviorImplementation)
         .filter(BehaviorImplementation.id == implementation_id)
@@ -301,64 +827,229 @@ async def run_tests_for_implementation(
     if not impl.language:
         raise PodmanRuntimeError(f"Implementation {implementation_id} has no language set")
 
+    return impl
+
+
+async def run_tests_for_implementation(
+    db: Session,
+    implementation_id: int,
+) -> PodmanResult:
+    """
+    Run tests for a single BehaviorImplementation in an ephemeral container.
+
+    Uses the LanguageAdapter's docker_image + build_command + test_command.
+    """
+    impl = _get_testable_implementation(db, implementation_id)
     adapter = get_adapter(impl.language)
 
-    # Workspace where we clone the repo
-    workspace_root = Path(os.path.abspath(settings.ANALYZER_WORKSPACE_ROOT))
-    workspace_root.mkdir(parents=True, exist_ok=True)
+    image = adapter.docker_image
+    await ensure_image(image)
+
+    # Full output goes to disk (see test_run_log_path); only tails stay inline.
+    await _maybe_prune_test_runs()
+    run_id = uuid.uuid4().hex
+    output_dir = _test_runs_root() / run_id
+
+    # The checkout stays locked through the run: the build writes into it,
+    # and another run must not check out or build there meanwhile.
+    async with checked_out_repos(
+        [(impl.repo_url, impl.revision or "main")], _runtime_workspace_root()
+    ) as (repo_root,):
+        # Build + test command inside the container
+        build_cmd = adapter.build_command("/code", host_root=repo_root)
+        test_cmd = adapter.test_command("/code", host_root=repo_root)
+
+        t0 = time.monotonic()
+        try:
+            runner = _sandbox_pool.run if _sandbox_pool is not None else _run_container
+            exec_res = await runner(
+                image,
+                {"/code": repo_root},
+                "/code",
+                _container_command(build_cmd, test_cmd),
+                output_dir,
+            )
+        except PodmanRuntimeError as exc:
+            # Re-raise with same info but include context about the implementation
+            raise PodmanRuntimeError(
+                f"Runtime test failed for implementation {implementation_id} (run {run_id}): {exc}",
+                stdout=exc.stdout,
+                stderr=exc.stderr,
+                exit_code=exc.exit_code,
+                run_id=run_id,
+            ) from exc
 
-    repo_root = await clone_or_update_repo(
-        repo_url=impl.repo_url,
-        base_dir=workspace_root,
-        revision=impl.revision or "main",
+    elapsed = time.monotonic() - t0
+    return PodmanResult(
+        exit_code=exec_res.exit_code,
+        stdout=exec_res.stdout,
+        stderr=exec_res.stderr,
+        container_image=image,
+        elapsed_seconds=elapsed,
+        run_id=run_id,
     )
 
-    image = adapter.docker_image
 
-    # Build + test command inside the container
-    build_cmd = adapter.build_command("/code")
-    test_cmd = adapter.test_command("/code")
-
-    parts: list[str] = []
-    if build_cmd:
-        parts.append(str(build_cmd))
-    parts.append(str(test_cmd))
-    joined_cmd = " && ".join(parts)
-
-    full_args = [
-        "run",
-        "--rm",
-        "-v",
-        f"{repo_root}:/code",
-        "-w",
-        "/code",
-        image,
-        "/bin/sh",
-        "-lc",
-        joined_cmd,
-    ]
+async def run_tests_for_implementations_parallel(
+    db: Session,
+    implementation_ids: List[int],
+    max_parallel: int,
+) -> dict[int, PodmanResult]:
+    """
+    Run tests for several implementations, each in its own container, with at
+    most `max_parallel` containers at a time.
+
+    A failing run doesn't abort the others: its PodmanRuntimeError is turned
+    into that implementation's result (exit_code -1 if the container never
+    produced one). Unknown/incomplete implementations are rejected up front.
+    """
+    images = {
+        impl_id: get_adapter(_get_testable_implementation(db, impl_id).language).docker_image
+        for impl_id in implementation_ids
+    }
+    sem = asyncio.Semaphore(max_parallel)
+
+    async def _one(impl_id: int) -> PodmanResult:
+        async with sem:
+            t0 = time.monotonic()
+            try:
+                return await run_tests_for_implementation(db, impl_id)
+            except PodmanRuntimeError as exc:
+                return PodmanResult(
+                    exit_code=exc.exit_code if exc.exit_code is not None else -1,
+                    stdout=exc.stdout,
+                    stderr=exc.stderr or exc.args[0],
+                    container_image=images[impl_id],
+                    elapsed_seconds=time.monotonic() - t0,
+                    run_id=exc.run_id,
+                )
+
+    results = await asyncio.gather(*(_one(impl_id) for impl_id in implementation_ids))
+    return dict(zip(implementation_ids, results))
+
+
+async def prefetch_images(images: List[str]) -> None:
+    """
+    Make sure the given images are local, pulling them concurrently.
+
+    Meant to run in the background at startup: failures are ignored (the
+    run path pulls again if needed), and requests that arrive mid-pull wait
+    on the same per-image lock in ensure_image() instead of pulling twice.
+    """
+    await asyncio.gather(
+        *(ensure_image(image) for image in dict.fromkeys(images)),
+        return_exceptions=True,
+    )
+
+
+# Per-implementation sections in a batch container's stdout/stderr. The END
+# marker is printed after a newline so unterminated output can't swallow it;
+# that newline is not part of the section.
+_BATCH_SECTION_RE = re.compile(
+    r"^###MLBE-BEGIN (\d+)###\n(.*?)\n###MLBE-END \1 exit=(\d+)###$",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+def _batch_script(items: list[tuple[int, str]]) -> str:
+    lines: list[str] = []
+    for impl_id, cmd in items:
+        begin = f"###MLBE-BEGIN {impl_id}###"
+        end = f"###MLBE-END {impl_id} exit=%s###"
+        lines.append(f"echo '{begin}'; echo '{begin}' >&2")
+        # Subshell: each implementation gets its own cwd and can't exit the batch.
+        lines.append(f"(cd /code/{impl_id} && {cmd}); rc=$?")
+        lines.append(f"printf '\\n{end}\\n' \"$rc\"; printf '\\n{end}\\n' \"$rc\" >&2")
+    return "\n".join(lines)
+
+
+def _split_batch_output(text: str) -> dict[int, tuple[str, int]]:
+    return {
+        int(m.group(1)): (m.group(2), int(m.group(3)))
+        for m in _BATCH_SECTION_RE.finditer(text)
+    }
+
+
+async def run_tests_for_implementations_batch(
+    db: Session,
+    implementation_ids: List[int],
+) -> dict[int, PodmanResult]:
+    """
+    Run tests for several implementations, one container per image.
+
+    Implementations sharing an image are mounted side by side under
+    /code/<implementation_id> and run sequentially by a single shell script,
+    so container startup is paid once per image instead of once per
+    implementation. Output is split back per implementation using marker
+    lines; elapsed_seconds is the wall time of the shared container.
+
+    An implementation whose section is missing (e.g. the container was killed
+    mid-run) is reported with exit_code -1.
+    """
+    impls = [_get_testable_implementation(db, impl_id) for impl_id in implementation_ids]
+
+    specs = [(impl.repo_url, impl.revision or "main") for impl in impls]
+
+    # All checkouts stay locked until every container has run (see
+    # checked_out_repos); implementations at the same repo revision share one.
+    async with checked_out_repos(specs, _runtime_workspace_root()) as repo_roots:
+        groups: dict[str, list[tuple[int, str, Path]]] = {}
+        for impl, repo_root in zip(impls, repo_roots):
+            adapter = get_adapter(impl.language)
+            project_root = f"/code/{impl.id}"
+            cmd = _shell_command(
+                adapter.build_command(project_root, host_root=repo_root),
+                adapter.test_command(project_root, host_root=repo_root),
+            )
+            groups.setdefault(adapter.docker_image, []).append((impl.id, cmd, repo_root))
+
+        results: dict[int, PodmanResult] = {}
+        for image, items in groups.items():
+            results.update(await _run_batch_group(image, items))
+
+    return results
+
+
+async def _run_batch_group(
+    image: str,
+    items: list[tuple[int, str, Path]],
+) -> dict[int, PodmanResult]:
+    """One batch container for the (impl_id, shell cmd, checkout) items sharing `image`."""
+    await ensure_image(image)
+
+    mounts: list[str] = []
+    for impl_id, _cmd, repo_root in items:
+        mounts.extend(("-v", f"{repo_root}:/code/{impl_id}"))
+    script = _batch_script([(impl_id, cmd) for impl_id, cmd, _root in items])
 
     t0 = time.monotonic()
     try:
-        exec_res = await run_podman(full_args, cwd=None)
+        exec_res = await run_podman(
+            ["run", "--rm", *mounts, "-w", "/code", image, "/bin/sh", "-lc", script],
+            cwd=None,
+        )
     except PodmanRuntimeError as exc:
-        elapsed = time.monotonic() - t0
-        # Re-raise with same info but include context about the implementation
         raise PodmanRuntimeError(
-            f"Runtime test failed for implementation {implementation_id}: {exc}",
+            f"Batch test run failed for image {image}: {exc}",
             stdout=exc.stdout,
             stderr=exc.stderr,
             exit_code=exc.exit_code,
         ) from exc
-
     elapsed = time.monotonic() - t0
-    return PodmanResult(
-        exit_code=exec_res.exit_code,
-        stdout=exec_res.stdout,
-        stderr=exec_res.stderr,
-        container_image=image,
-        elapsed_seconds=elapsed,
-    )
+
+    out = _split_batch_output(exec_res.stdout)
+    err = _split_batch_output(exec_res.stderr)
+    results: dict[int, PodmanResult] = {}
+    for impl_id, _cmd, _root in items:
+        stdout, exit_code = out.get(impl_id, ("", -1))
+        results[impl_id] = PodmanResult(
+            exit_code=exit_code,
+            stdout=stdout,
+            stderr=err.get(impl_id, ("", exit_code))[0],
+            container_image=image,
+            elapsed_seconds=elapsed,
+        )
+    return results
 
 
 async def run_legacy_with_harness(
@@ -406,53 +1097,47 @@ async def run_legacy_with_harness(
     language = legacy_impl.language
     adapter = get_adapter(language)
 
-    workspace_root = Path(os.path.abspath(settings.ANALYZER_WORKSPACE_ROOT))
-    workspace_root.mkdir(parents=True, exist_ok=True)
-
-    legacy_root = await clone_or_update_repo(
-        repo_url=legacy_impl.repo_url,
-        base_dir=workspace_root,
-        revision=legacy_impl.revision or "main",
-    )
-    harness_root = await clone_or_update_repo(
-        repo_url=harness_impl.repo_url,
-        base_dir=workspace_root,
-        revision=harness_impl.revision or "main",
-    )
-
     image = adapter.docker_image
-    test_cmd = adapter.run_contract_test_command(
-        behavior_id=behavior_id,
-        contract_id=contract_id,
-        project_root="/tests",
-    )
-
-    full_args = [
-        "run",
-        "--rm",
-        "-v",
-        f"{legacy_root}:/code",
-        "-v",
-        f"{harness_root}:/tests",
-        "-w",
-        "/tests",
-        image,
-        "/bin/sh",
-        "-lc",
-        str(test_cmd),
-    ]
+    await ensure_image(image)
+
+    # Logged (and pruned) like run_tests_for_implementation.
+    await _maybe_prune_test_runs()
+    run_id = uuid.uuid4().hex
+    output_dir = _test_runs_root() / run_id
+
+    # Both checkouts stay locked through the run (see checked_out_repos).
+    async with checked_out_repos(
+        [
+            (legacy_impl.repo_url, legacy_impl.revision or "main"),
+            (harness_impl.repo_url, harness_impl.revision or "main"),
+        ],
+        _runtime_workspace_root(),
+    ) as (legacy_root, harness_root):
+        test_cmd = adapter.run_contract_test_command(
+            behavior_id=behavior_id,
+            contract_id=contract_id,
+            project_root="/tests",
+            host_root=harness_root,
+        )
 
-    t0 = time.monotonic()
-    try:
-        exec_res = await run_podman(full_args, cwd=None)
-    except PodmanRuntimeError as exc:
-        elapsed = time.monotonic() - t0
-        raise PodmanRuntimeError(
-            f"Legacy+harness test failed: {exc}",
-            stdout=exc.stdout,
-            stderr=exc.stderr,
-            exit_code=exc.exit_code,
-        ) from exc
+        t0 = time.monotonic()
+        try:
+            runner = _sandbox_pool.run if _sandbox_pool is not None else _run_container
+            exec_res = await runner(
+                image,
+                {"/code": legacy_root, "/tests": harness_root},
+                "/tests",
+                _container_command(test_cmd),
+                output_dir,
+            )
+        except PodmanRuntimeError as exc:
+            raise PodmanRuntimeError(
+                f"Legacy+harness test failed (run {run_id}): {exc}",
+                stdout=exc.stdout,
+                stderr=exc.stderr,
+                exit_code=exc.exit_code,
+                run_id=run_id,
+            ) from exc
 
     elapsed = time.monotonic() - t0
     return PodmanResult(
@@ -461,4 +1146,5 @@ async def run_legacy_with_harness(
         stderr=exec_res.stderr,
         container_image=image,
         elapsed_seconds=elapsed,
+        run_id=run_id,
     )
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from pathlib import PurePosixPath
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
+from app.db.session import SessionLocal
 from app.models.behavior_implementation import BehaviorImplementation
 from app.services.conversion_engine import (
     convert_behavior_stub,
@@ -17,6 +19,10 @@ from app.services.converted_tests_builder import (
 )
 
 
+# Upper bound on behaviors converted concurrently within one project.
+_MAX_CONCURRENT_BEHAVIORS = 8
+
+
 class ProjectConversionError(Exception):
     pass
 
@@ -105,7 +111,7 @@ async def convert_project(
 
     1. Discover all behaviors that have a source implementation in the given
        repo + language.
-    2. For each behavior_id:
+    2. For each behavior_id (concurrently, bounded):
          - call convert_behavior_stub (which writes to GitHub)
          - immediately call build_converted_tests_for_implementation so that
            unit tests are generated in the same repo for the new code.
@@ -139,14 +145,11 @@ async def convert_project(
         target_language=target_language,
     )
 
-    converted_impls: List[BehaviorImplementation] = []
-    target_repo_url: Optional[str] = None
-
-    for behavior_id in behavior_ids:
+    async def _convert_one(session: Session, behavior_id: int) -> BehaviorImplementation:
         # --- Step 1: per-behavior conversion ---
         try:
             impl = await convert_behavior_stub(
-                db=db,
+                db=session,
                 behavior_id=behavior_id,
                 source_language=source_language,
                 target_language=target_language,
@@ -158,25 +161,72 @@ async def convert_project(
                 f"Conversion failed for behavior {behavior_id}: {exc}"
             ) from exc
 
-        # Capture repo_url from the first converted implementation
-        if target_repo_url is None and impl.repo_url:
-            target_repo_url = impl.repo_url
-
         # --- Step 2: generate tests in the *same* repo ---
         try:
-            impl_with_tests = await build_converted_tests_for_implementation(
-                db=db,
+            return await build_converted_tests_for_implementation(
+                db=session,
                 implementation_id=impl.id,
                 contract_id=contract_id,
             )
         except ConvertedTestsError as exc:
-            # If test generation fails, we still surface the error and abort.
             raise ProjectConversionError(
                 f"Converted tests generation failed for behavior {behavior_id}, "
                 f"implementation {impl.id}: {exc}"
             ) from exc
 
-        converted_impls.append(impl_with_tests)
+    # The first behavior runs alone so the shared target repo is created
+    # exactly once; the rest fan out under a bound so their LLM calls
+    # overlap. Their writes to that repo (code, requirements.txt, tests/)
+    # are serialized per repo by GitHubClient.create_or_update_file.
+    first = await _convert_one(db, behavior_ids[0])
+
+    sem = asyncio.Semaphore(_MAX_CONCURRENT_BEHAVIORS)
+
+    async def _bounded(behavior_id: int) -> int:
+        # Each concurrent task gets its own Session: their commits/rollbacks
+        # must not expire or undo each other's objects.
+        async with sem:
+            session = SessionLocal()
+            try:
+                impl = await _convert_one(session, behavior_id)
+                return impl.id
+            finally:
+                session.close()
+
+    results = await asyncio.gather(
+        *(_bounded(bid) for bid in behavior_ids[1:]),
+        return_exceptions=True,
+    )
+
+    converted_ids: List[int] = []
+    failures: List[str] = []
+    for result in results:
+        if isinstance(result, ProjectConversionError):
+            failures.append(str(result))
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            converted_ids.append(result)
+
+    if failures:
+        # Every behavior has been attempted (and the successful ones are
+        # committed) before we surface the errors.
+        raise ProjectConversionError("; ".join(failures))
+
+    # Re-read the rows the worker sessions committed into the caller's
+    # Session, in behavior order.
+    by_id = {
+        impl.id: impl
+        for impl in db.query(BehaviorImplementation).filter(
+            BehaviorImplementation.id.in_(converted_ids)
+        )
+    }
+    converted_impls: List[BehaviorImplementation] = [first]
+    converted_impls.extend(by_id[impl_id] for impl_id in converted_ids)
+
+    target_repo_url = next(
+        (impl.repo_url for impl in converted_impls if impl.repo_url), None
+    )
 
     if target_repo_url is None:
         # This should not happen if at least one impl has repo_url set.
@@ -65,15 +65,17 @@ def _iter_language_files(root: str, language: str) -> List[str]:
     Walk the repo and yield all files that match the adapter's file_extensions.
     """
     adapter = get_adapter(language)
-    exts = set(adapter.file_extensions)
+    exts = frozenset(adapter.file_extensions)
+    splitext = os.path.splitext
 
     results: List[str] = []
     for dirpath, _dirnames, filenames in os.walk(root):
         for fn in filenames:
-            p = Path(dirpath, fn)
-            if p.suffix in exts:
+            # splitext matches Path.suffix (".pl" alone has no suffix) without
+            # building a Path per file.
+            if splitext(fn)[1] in exts:
                 # Store repo-relative paths
-                rel = os.path.relpath(p, root)
+                rel = os.path.relpath(os.path.join(dirpath, fn), root)
                 results.append(rel)
     return sorted(results)
 
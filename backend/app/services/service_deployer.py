@@ -8,6 +8,7 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from app.adapters.base import write_if_changed
 from app.core.config import settings
 from app.models.behavior_implementation import BehaviorImplementation
 from app.services.podman_runner import (
@@ -228,7 +229,7 @@ async def deploy_behavior_service(
         # Write app.psgi that wraps the CGI script.
         app_psgi_path = repo_root / "app.psgi"
         app_psgi_code = _render_perl_psgi_app(file_path)
-        app_psgi_path.write_text(app_psgi_code)
+        write_if_changed(app_psgi_path, app_psgi_code)
 
         dockerfile_code = _render_perl_ui_dockerfile()
         internal_port = 5000
@@ -248,8 +249,10 @@ async def deploy_behavior_service(
         )
 
     # --- 3. Write Dockerfile ---
+    # Identical content is left untouched so its mtime (and the build cache
+    # keyed on it) survives redeploys.
     dockerfile_path = repo_root / "Dockerfile"
-    dockerfile_path.write_text(dockerfile_code)
+    write_if_changed(dockerfile_path, dockerfile_code)
 
     # --- 4. Build image ---
     image_name = f"mlbe-svc-{language}-impl-{implementation_id}"
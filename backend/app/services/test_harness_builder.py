@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -182,7 +181,6 @@ async def build_legacy_test_harness(
             ) from exc
 
     # --- DB record for harness implementation ---
-    now = datetime.utcnow()
     notes_lines = [
         "# Legacy Test Harness",
         "",
@@ -213,8 +211,6 @@ async def build_legacy_test_harness(
         # IMPORTANT: use an existing enum value; we treat this semantically as a harness.
         status="candidate",
         notes=notes_md,
-        created_at=now,
-        updated_at=now,
     )
 
     db.add(harness_impl)
@@ -0,0 +1,69 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Local pull-through registry caches, so base-image layers (perl, python, ...)
+# come from localhost after the first pull instead of the upstream registry.
+#
+# - one `registry:2` container per upstream, in proxy mode, named
+#   registry-cache-<name> (deliberately not mlbe-*, so reset_everything.sh
+#   leaves the caches alone)
+# - a registries.conf.d drop-in pointing podman at them as mirrors
+#
+# Safe to re-run. To have the backend start the caches on boot, set e.g.
+#   REGISTRY_CACHE_CONTAINERS=registry-cache-dockerio,registry-cache-quayio,registry-cache-ghcrio
+
+CACHE_IMAGE="${CACHE_IMAGE:-docker.io/library/registry:2}"
+
+# name|upstream registry|proxy remote URL|local port
+CACHES=(
+  "dockerio|docker.io|https://registry-1.docker.io|5051"
+  "quayio|quay.io|https://quay.io|5052"
+  "ghcrio|ghcr.io|https://ghcr.io|5053"
+)
+
+if [ "$(id -u)" -eq 0 ]; then
+  CONF_DIR="/etc/containers/registries.conf.d"
+else
+  CONF_DIR="${XDG_CONFIG_HOME:-$HOME/.config}/containers/registries.conf.d"
+fi
+CONF_FILE="${CONF_DIR}/mlbe-cache.conf"
+
+echo "=== [1/2] Starting pull-through caches ==="
+for entry in "${CACHES[@]}"; do
+  IFS='|' read -r name upstream remote port <<<"$entry"
+  container="registry-cache-${name}"
+
+  if podman container exists "$container"; then
+    podman start "$container" >/dev/null
+    echo "${container}: running (existing)"
+  else
+    podman run -d \
+      --name "$container" \
+      --restart=always \
+      -p "127.0.0.1:${port}:5000" \
+      -v "${container}:/var/lib/registry" \
+      -e "REGISTRY_PROXY_REMOTEURL=${remote}" \
+      "$CACHE_IMAGE" >/dev/null
+    echo "${container}: started for ${upstream} on localhost:${port}"
+  fi
+done
+
+echo "=== [2/2] Writing ${CONF_FILE} ==="
+mkdir -p "$CONF_DIR"
+{
+  echo "# Generated by backend/scripts/setup_registry_cache.sh"
+  for entry in "${CACHES[@]}"; do
+    IFS='|' read -r name upstream remote port <<<"$entry"
+    cat <<EOF
+
+[[registry]]
+location = "${upstream}"
+
+[[registry.mirror]]
+location = "localhost:${port}"
+insecure = true
+EOF
+  done
+} >"$CONF_FILE"
+
+echo "Done. Podman now pulls through the local caches."